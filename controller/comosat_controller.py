@@ -19,11 +19,128 @@ from ryu.controller import ofp_event
 from ryu.controller.handler import CONFIG_DISPATCHER, MAIN_DISPATCHER
 from ryu.controller.handler import set_ev_cls
 from ryu.ofproto import ofproto_v1_3
-from ryu.lib.packet import packet, ethernet, ipv4
 from ryu.lib.packet import ether_types
-from ryu.lib import hub
+from ryu.lib import addrconv
+from collections.abc import Mapping
+from functools import lru_cache
 import json
+import mmap
 import os
+import struct
+import time
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib parser
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:  # Optional: slot diffs use the NumPy path
+    njit = None
+
+# Resolved once at import time so lookups don't depend on the cwd
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_TOPOLOGY_DIR = os.path.normpath(os.path.join(_HERE, '..', 'topology'))
+
+# Ethernet header: dst MAC, src MAC, ethertype
+_unpack_eth = struct.Struct('!6s6sH').unpack_from
+
+# Ethertype that follows a VLAN tag, read at the tag's offset + 4
+_unpack_ethertype = struct.Struct('!H').unpack_from
+
+# Tag protocol IDs of 802.1Q / 802.1ad (QinQ) VLAN tags
+_VLAN_TPIDS = (ether_types.ETH_TYPE_8021Q, ether_types.ETH_TYPE_8021AD)
+
+
+@lru_cache(maxsize=4)
+def _load_json(path, mtime_ns):
+    """
+    Parse a JSON file through a read-only memory map.
+    
+    Results are memoized on (path, mtime_ns), so reloading an unchanged
+    file returns the already-parsed dictionary.
+    
+    Args:
+        path: Path to the JSON file
+        mtime_ns: Modification time of the file (cache key only)
+        
+    Returns:
+        Parsed JSON data
+    """
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            if orjson is not None:
+                with memoryview(buf) as view:
+                    return orjson.loads(view)
+            return json.loads(buf[:])
+
+
+def _slot_arrays(slot_data):
+    """
+    Convert a slot's node_positions list into per-field NumPy arrays.
+    
+    Args:
+        slot_data: Time slot dictionary with 'node_positions'
+        
+    Returns:
+        Dictionary with int32 'domain' and 'controller' arrays indexed by dpid - 1
+    """
+    positions = slot_data['node_positions']
+    count = len(positions)
+    return {
+        'domain': np.fromiter((pos.get('domain', 0) for pos in positions),
+                              dtype=np.int32, count=count),
+        'controller': np.fromiter((pos.get('controller', 0) for pos in positions),
+                                  dtype=np.int32, count=count)
+    }
+
+
+# Slots with at least this many nodes are diffed with the JIT kernel
+_JIT_DIFF_MIN_NODES = 20000
+
+if njit is not None:
+    @njit(cache=True)
+    def _diff_controllers(old_ctrl, new_ctrl, out_idx, out_new):
+        """Write changed indices/new controllers in one pass; return count."""
+        n = 0
+        for i in range(old_ctrl.size):
+            if old_ctrl[i] != new_ctrl[i]:
+                out_idx[n] = i
+                out_new[n] = new_ctrl[i]
+                n += 1
+        return n
+else:
+    _diff_controllers = None
+
+
+class _ArrayMapping(Mapping):
+    """
+    Read-only dpid -> value view over an array indexed by dpid - 1.
+    
+    Keeps the dict-style API of the assignment tables while the data
+    itself lives in a dense NumPy array.
+    """
+    
+    __slots__ = ('_array',)
+    
+    def __init__(self, array):
+        self._array = array
+    
+    def __contains__(self, dpid):
+        return isinstance(dpid, (int, np.integer)) and 1 <= dpid <= self._array.size
+    
+    def __getitem__(self, dpid):
+        if dpid not in self:
+            raise KeyError(dpid)
+        return int(self._array[dpid - 1])
+    
+    def __iter__(self):
+        return iter(range(1, self._array.size + 1))
+    
+    def __len__(self):
+        return self._array.size
 
 
 class COMOSATController(app_manager.RyuApp):
@@ -35,13 +152,22 @@ class COMOSATController(app_manager.RyuApp):
     
     OFP_VERSIONS = [ofproto_v1_3.OFP_VERSION]
     
+    # Statistics are logged once this many new flows/packets accumulate,
+    # and at most once per STATS_LOG_INTERVAL seconds
+    STATS_LOG_THRESHOLD = 1000
+    STATS_LOG_INTERVAL = 1.0
+    
+    # Upper bound on learned (in_port, eth_src) keys kept per datapath
+    LEARNED_KEYS_MAX = 10000
+    
     def __init__(self, *args, **kwargs):
         super(COMOSATController, self).__init__(*args, **kwargs)
         
-        # Domain and controller assignments
-        self.domain_assignments = {}  # dpid -> domain_id
-        self.controller_assignments = {}  # dpid -> controller_node_id
-        self.switch_domains = {}  # domain_id -> [dpid list]
+        # Domain and controller assignments, indexed by dpid - 1
+        self._dom = np.zeros(0, dtype=np.int32)  # dpid -> domain_id
+        self._ctrl = np.zeros(0, dtype=np.int32)  # dpid -> controller_node_id
+        self.switch_domains = {}  # domain_id -> array of dpids
+        self._peers = {}  # dpid -> tuple of other dpids in the same domain
         
         # Statistics tracking
         self.stats = {
@@ -49,23 +175,35 @@ class COMOSATController(app_manager.RyuApp):
             'flow_rules_installed': 0,
             'packets_processed': 0
         }
+        self._last_logged_flows = 0
+        self._last_logged_packets = 0
+        self._last_log_time = 0.0
         
         # Load topology data if available
         self.topology_data = None
+        self._slots = []  # Per-slot SoA arrays built from topology_data
         self.load_topology_data()
-        
-        # Start background thread for monitoring
-        self.monitor_thread = hub.spawn(self._monitor)
+    
+    @property
+    def domain_assignments(self):
+        """Mapping of dpid -> domain_id for the loaded slot."""
+        return _ArrayMapping(self._dom)
+    
+    @property
+    def controller_assignments(self):
+        """Mapping of dpid -> controller_node_id for the loaded slot."""
+        return _ArrayMapping(self._ctrl)
     
     def load_topology_data(self):
         """Load topology data from JSON file."""
-        json_file = os.path.join(os.path.dirname(__file__), 
-                                 '../topology/mininet_topology_data.json')
+        json_file = os.path.join(_TOPOLOGY_DIR, 'mininet_topology_data.json')
         
         if os.path.exists(json_file):
             try:
-                with open(json_file, 'r') as f:
-                    self.topology_data = json.load(f)
+                st = os.stat(json_file)
+                self.topology_data = _load_json(json_file, st.st_mtime_ns)
+                self._slots = [_slot_arrays(slot_data)
+                               for slot_data in self.topology_data['time_slots']]
                 self.logger.info('Topology data loaded from %s', json_file)
             except Exception as e:
                 self.logger.error('Failed to load topology data: %s', e)
@@ -87,26 +225,28 @@ class COMOSATController(app_manager.RyuApp):
             self.logger.error('Time slot %d exceeds available slots', slot)
             return
         
-        slot_data = self.topology_data['time_slots'][slot - 1]
-        
-        # Clear previous assignments
-        self.domain_assignments.clear()
-        self.controller_assignments.clear()
-        self.switch_domains.clear()
-        
-        # Load new assignments from slot data
-        for idx, pos in enumerate(slot_data['node_positions']):
-            dpid = idx + 1  # dpid is 1-indexed
-            domain_id = pos.get('domain', 0)
-            controller_id = pos.get('controller', 0)
-            
-            self.domain_assignments[dpid] = domain_id
-            self.controller_assignments[dpid] = controller_id
-            
-            # Group switches by domain
-            if domain_id not in self.switch_domains:
-                self.switch_domains[domain_id] = []
-            self.switch_domains[domain_id].append(dpid)
+        domains = self._slots[slot - 1]['domain']
+        controllers = self._slots[slot - 1]['controller']
+        
+        # Load new assignments from slot data; the controller array is
+        # copied because remappings write into it
+        self._dom = domains
+        self._ctrl = controllers.copy()
+        
+        # Group switches by domain: sort dpids by domain, split at boundaries
+        order = np.argsort(domains, kind='stable')
+        domain_ids, starts = np.unique(domains[order], return_index=True)
+        self.switch_domains = dict(zip(domain_ids.tolist(),
+                                       np.split(order + 1, starts[1:])))
+        
+        # Precompute each switch's intra-domain peers (unassigned domain 0 skipped)
+        self._peers = {}
+        for domain_id, members in self.switch_domains.items():
+            if domain_id == 0:
+                continue
+            members = members.tolist()
+            for dpid in members:
+                self._peers[dpid] = tuple(d for d in members if d != dpid)
         
         self.logger.info('Loaded domain assignments for slot %d: %d domains',
                         slot, len(self.switch_domains))
@@ -131,6 +271,14 @@ class COMOSATController(app_manager.RyuApp):
                                           ofproto.OFPCML_NO_BUFFER)]
         self._add_flow(datapath, 0, match, actions)
         
+        # Cache the flood action/instruction lists reused by every packet-in
+        datapath._flood_actions = [parser.OFPActionOutput(ofproto.OFPP_FLOOD)]
+        datapath._flood_inst = [parser.OFPInstructionActions(
+            ofproto.OFPIT_APPLY_ACTIONS, datapath._flood_actions)]
+        
+        # Packed (in_port << 48 | eth_src) keys with a learning flow installed
+        datapath._seen_keys = set()
+        
         self.logger.info('Switch %016x connected', dpid)
         
         # Assign switch to domain if topology data is loaded
@@ -141,7 +289,7 @@ class COMOSATController(app_manager.RyuApp):
             # Install domain-based flow rules
             self._install_domain_rules(datapath)
     
-    def _add_flow(self, datapath, priority, match, actions, buffer_id=None):
+    def _add_flow(self, datapath, priority, match, actions, buffer_id=None, inst=None):
         """
         Install a flow rule in the switch.
         
@@ -151,11 +299,13 @@ class COMOSATController(app_manager.RyuApp):
             match: OFP match object
             actions: List of OFP action objects
             buffer_id: Buffer ID (optional)
+            inst: Prebuilt instruction list for actions (optional)
         """
         ofproto = datapath.ofproto
         parser = datapath.ofproto_parser
         
-        inst = [parser.OFPInstructionActions(ofproto.OFPIT_APPLY_ACTIONS, actions)]
+        if inst is None:
+            inst = [parser.OFPInstructionActions(ofproto.OFPIT_APPLY_ACTIONS, actions)]
         
         if buffer_id:
             mod = parser.OFPFlowMod(datapath=datapath, buffer_id=buffer_id,
@@ -166,6 +316,7 @@ class COMOSATController(app_manager.RyuApp):
         
         datapath.send_msg(mod)
         self.stats['flow_rules_installed'] += 1
+        self._log_statistics()
     
     def _install_domain_rules(self, datapath):
         """
@@ -192,9 +343,8 @@ class COMOSATController(app_manager.RyuApp):
         ofproto = datapath.ofproto
         parser = datapath.ofproto_parser
         
-        # Get all switches in the same domain
-        domain_switches = self.switch_domains.get(domain_id, [])
-        domain_switches.remove(dpid)  # Remove self
+        # Get all other switches in the same domain
+        domain_switches = self._peers.get(dpid, ())
         
         # Install flow rules for intra-domain communication
         # For each switch in the domain, forward to that switch
@@ -215,29 +365,50 @@ class COMOSATController(app_manager.RyuApp):
         """
         msg = ev.msg
         datapath = msg.datapath
-        ofproto = datapath.ofproto
         parser = datapath.ofproto_parser
         in_port = msg.match['in_port']
         
         dpid = datapath.id
         self.stats['packets_processed'] += 1
+        self._log_statistics()
+        
+        # Fast path: read the Ethernet header directly from the raw bytes
+        try:
+            _, src, ethertype = _unpack_eth(msg.data)
+        except struct.error:
+            return  # Truncated frame
+        
+        # Skip VLAN tags to reach the encapsulated ethertype. 802.3 frames
+        # carry a length (< 0x0600) here and are never LLDP, so they need
+        # no further decoding.
+        offset = 12
+        while ethertype in _VLAN_TPIDS:
+            offset += 4
+            try:
+                ethertype, = _unpack_ethertype(msg.data, offset)
+            except struct.error:
+                return  # Truncated frame
         
-        pkt = packet.Packet(msg.data)
-        eth = pkt.get_protocols(ethernet.ethernet)[0]
-        
-        if eth.ethertype == ether_types.ETH_TYPE_LLDP:
+        if ethertype == ether_types.ETH_TYPE_LLDP:
             # Ignore LLDP packets
             return
         
-        dst = eth.dst
-        src = eth.src
-        
         # Simple learning switch: flood and install flow
-        actions = [parser.OFPActionOutput(ofproto.OFPP_FLOOD)]
-        
-        # Install flow rule for reverse path
-        match = parser.OFPMatch(in_port=in_port, eth_dst=src)
-        self._add_flow(datapath, 1, match, actions)
+        actions = datapath._flood_actions
+        
+        # Install flow rule for reverse path, once per (in_port, eth_src).
+        # Repeat misses (e.g. a burst arriving before the rule lands) only
+        # need the packet-out below.
+        key = (in_port << 48) | int.from_bytes(src, 'big')
+        seen = datapath._seen_keys
+        if key not in seen:
+            if len(seen) >= self.LEARNED_KEYS_MAX:
+                seen.clear()
+            seen.add(key)
+            match = parser.OFPMatch(in_port=in_port,
+                                    eth_dst=addrconv.mac.bin_to_text(src))
+            self._add_flow(datapath, 1, match, actions,
+                           inst=datapath._flood_inst)
         
         # Send packet
         out = parser.OFPPacketOut(datapath=datapath, buffer_id=msg.buffer_id,
@@ -255,28 +426,50 @@ class COMOSATController(app_manager.RyuApp):
         Args:
             remappings: List of remapping dictionaries
                        [{'node_id': x, 'old_controller': y, 'new_controller': z}]
+                       or a (node_indices, new_controllers) tuple of arrays,
+                       where node_indices are 0-indexed (dpid - 1)
         """
+        if isinstance(remappings, tuple):
+            idx, new_controllers = remappings
+            valid = idx < self._ctrl.size
+            self._ctrl[idx[valid]] = new_controllers[valid]
+            self.stats['remappings'] += int(np.count_nonzero(valid))
+            self.logger.info('Remapped %d nodes', np.count_nonzero(valid))
+            return
+        
         for remap in remappings:
             node_id = remap['node_id']
             old_controller = remap['old_controller']
             new_controller = remap['new_controller']
             
             if node_id in self.controller_assignments:
-                self.controller_assignments[node_id] = new_controller
+                self._ctrl[node_id - 1] = new_controller
                 self.logger.info('Remapped node %d: controller %d -> %d',
                                 node_id, old_controller, new_controller)
                 self.stats['remappings'] += 1
     
-    def _monitor(self):
-        """Background thread for monitoring and statistics."""
-        while True:
-            hub.sleep(10)  # Run every 10 seconds
-            
-            # Log statistics
-            self.logger.info('Statistics: remappings=%d, flows=%d, packets=%d',
-                            self.stats['remappings'],
-                            self.stats['flow_rules_installed'],
-                            self.stats['packets_processed'])
+    def _log_statistics(self):
+        """
+        Log statistics when enough activity has accumulated.
+        
+        Called from the flow/packet hot paths instead of a periodic timer, so
+        an idle controller never wakes up and a busy one logs once per burst.
+        """
+        flows = self.stats['flow_rules_installed']
+        packets = self.stats['packets_processed']
+        if (flows - self._last_logged_flows < self.STATS_LOG_THRESHOLD and
+                packets - self._last_logged_packets < self.STATS_LOG_THRESHOLD):
+            return
+        
+        now = time.monotonic()
+        if now - self._last_log_time < self.STATS_LOG_INTERVAL:
+            return
+        
+        self.logger.info('Statistics: remappings=%d, flows=%d, packets=%d',
+                        self.stats['remappings'], flows, packets)
+        self._last_logged_flows = flows
+        self._last_logged_packets = packets
+        self._last_log_time = now
     
     def get_statistics(self):
         """
@@ -300,6 +493,62 @@ class MultiDomainCOMOSATController:
         self.topology_data = topology_data
         self.domain_controllers = {}
         self.current_slot = 1
+        self._slots = {}  # slot -> SoA arrays, built on first use
+        self._diff_cache = {}  # (old_slot, new_slot) -> remapping arrays
+    
+    def _slot(self, slot):
+        """
+        Get the SoA arrays of a time slot, building them on first use.
+        
+        Args:
+            slot: Time slot number (1-indexed)
+            
+        Returns:
+            Dictionary of per-slot arrays (see _slot_arrays)
+        """
+        arrays = self._slots.get(slot)
+        if arrays is None:
+            arrays = _slot_arrays(self.topology_data['time_slots'][slot - 1])
+            self._slots[slot] = arrays
+        return arrays
+    
+    def _slot_diff(self, old_slot, new_slot):
+        """
+        Compute controller remappings between two slots.
+        
+        Slot data is immutable after load, so results are memoized per
+        (old_slot, new_slot) pair.
+        
+        Args:
+            old_slot: Current time slot number
+            new_slot: New time slot number
+            
+        Returns:
+            (node_indices, new_controllers) tuple of read-only arrays
+        """
+        key = (old_slot, new_slot)
+        if key in self._diff_cache:
+            return self._diff_cache[key]
+        
+        old_ctrl = self._slot(old_slot)['controller']
+        new_ctrl = self._slot(new_slot)['controller']
+        count = min(old_ctrl.size, new_ctrl.size)
+        old_ctrl, new_ctrl = old_ctrl[:count], new_ctrl[:count]
+        
+        if _diff_controllers is not None and count >= _JIT_DIFF_MIN_NODES:
+            # Single pass without the temporary boolean mask
+            out_idx = np.empty(count, dtype=np.intp)
+            out_new = np.empty(count, dtype=new_ctrl.dtype)
+            n = _diff_controllers(old_ctrl, new_ctrl, out_idx, out_new)
+            remappings = (out_idx[:n].copy(), out_new[:n].copy())
+        else:
+            changed = np.flatnonzero(old_ctrl != new_ctrl)
+            remappings = (changed, new_ctrl[changed])
+        for arr in remappings:
+            arr.flags.writeable = False
+        
+        self._diff_cache[key] = remappings
+        return remappings
     
     def update_topology(self, new_slot):
         """
@@ -314,21 +563,8 @@ class MultiDomainCOMOSATController:
         if new_slot > len(self.topology_data['time_slots']):
             return 0
         
-        old_slot_data = self.topology_data['time_slots'][self.current_slot - 1]
-        new_slot_data = self.topology_data['time_slots'][new_slot - 1]
-        
-        # Find remappings
-        remappings = []
-        for i, (old_pos, new_pos) in enumerate(zip(
-                old_slot_data['node_positions'],
-                new_slot_data['node_positions'])):
-            
-            if old_pos['controller'] != new_pos['controller']:
-                remappings.append({
-                    'node_id': i + 1,
-                    'old_controller': old_pos['controller'],
-                    'new_controller': new_pos['controller']
-                })
+        # Find remappings as (node index, new controller) arrays
+        remappings = self._slot_diff(self.current_slot, new_slot)
         
         # Notify all domain controllers
         for controller in self.domain_controllers.values():
@@ -337,7 +573,7 @@ class MultiDomainCOMOSATController:
         
         self.current_slot = new_slot
         
-        return len(remappings)
+        return int(remappings[0].size)
 
 
 if __name__ == '__main__':
@@ -17,19 +17,44 @@ import sys
 import time
 import json
 import subprocess
-from threading import Thread
-from mininet.net import Mininet
+from threading import Thread, Event
+import numpy as np
 from mininet.log import setLogLevel, info, error
-from mininet.node import OVSSwitch, Controller, RemoteController
-from mininet.link import TCLink
 
-# Add paths for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../topology'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../controller'))
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib serializer
+    orjson = None
+
+# Resolved once at import time so lookups don't depend on the cwd
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_BASE_DIR = os.path.dirname(_HERE)
+_TOPOLOGY_DIR = os.path.join(_BASE_DIR, 'topology')
+_CONTROLLER_DIR = os.path.join(_BASE_DIR, 'controller')
+_RESULTS_DIR = os.path.join(_BASE_DIR, 'results')
+
+# Add paths for imports (once, even if this module is re-imported)
+for _path in (_TOPOLOGY_DIR, _CONTROLLER_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 from sagin_topology import SAGINTopology, DynamicTopologyManager, load_topology_data
 
 
+def _count_domains(slot_data):
+    """
+    Count the assigned (non-zero) domains in a time slot.
+    
+    Args:
+        slot_data: Time slot dictionary with the '_domains' array
+        
+    Returns:
+        Number of unique domains
+    """
+    domains = slot_data['_domains']  # Built by load_topology_data
+    return int(np.unique(domains[domains > 0]).size)
+
+
 class SAGINOrchestrator:
     """
     Main orchestrator for SAGIN network simulation.
@@ -52,12 +77,14 @@ class SAGINOrchestrator:
         """
         self.topology_data = load_topology_data(json_file)
         self.topology_manager = DynamicTopologyManager(self.topology_data)
+        self._num_domains_per_slot = {}  # slot -> domain count, filled on demand
         self.num_slots = num_slots
         self.slot_duration = slot_duration
         
         self.net = None
         self.metrics = []
         self.current_slot = 1
+        self._stop_evt = Event()  # Set to end the slot loop early
         
         # Controller configuration
         self.remote_controller_ip = remote_controller_ip
@@ -66,6 +93,11 @@ class SAGINOrchestrator:
         
         # Ryu controller process (only for local controller)
         self.ryu_process = None
+        self._ryu_log = None
+        
+        # Check the output location once instead of on every export
+        self._results_writable = (os.path.exists(_RESULTS_DIR) and
+                                  os.access(_RESULTS_DIR, os.W_OK))
         
     def start_ryu_controller(self):
         """
@@ -76,28 +108,30 @@ class SAGINOrchestrator:
         """
         info('Starting Ryu controller...\n')
         
-        controller_script = os.path.join(
-            os.path.dirname(__file__), 
-            '../controller/comosat_controller.py'
-        )
+        controller_script = os.path.join(_CONTROLLER_DIR, 'comosat_controller.py')
         
         if not os.path.exists(controller_script):
             error('Controller script not found: %s\n' % controller_script)
             return None
         
         try:
-            # Start Ryu controller
+            # Start Ryu controller; its output goes to a log file because an
+            # undrained pipe fills up and blocks the controller on write
+            log_file = self._output_path('ryu.log')
+            self._ryu_log = open(log_file, 'ab', buffering=0)
             proc = subprocess.Popen(
                 ['ryu-manager', '--verbose', controller_script],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+                stdout=self._ryu_log,
+                stderr=subprocess.STDOUT,
+                close_fds=True
             )
             
-            info('Ryu controller started (PID: %d)\n' % proc.pid)
+            info('Ryu controller started (PID: %d, log: %s)\n' % (proc.pid, log_file))
             return proc
             
         except Exception as e:
             error('Failed to start Ryu controller: %s\n' % str(e))
+            self._close_ryu_log()
             return None
     
     def stop_ryu_controller(self):
@@ -110,6 +144,13 @@ class SAGINOrchestrator:
             except subprocess.TimeoutExpired:
                 self.ryu_process.kill()
             self.ryu_process = None
+        self._close_ryu_log()
+    
+    def _close_ryu_log(self):
+        """Close the Ryu controller log file, if open."""
+        if self._ryu_log:
+            self._ryu_log.close()
+            self._ryu_log = None
     
     def setup_network(self, slot=1):
         """
@@ -118,6 +159,11 @@ class SAGINOrchestrator:
         Args:
             slot: Time slot number (1-indexed)
         """
+        # Imported here so metrics export/plotting don't pay for Mininet
+        from mininet.net import Mininet
+        from mininet.node import OVSSwitch, Controller, RemoteController
+        from mininet.link import TCLink
+        
         info('Setting up network for time slot %d...\n' % slot)
         
         # Create topology
@@ -190,22 +236,19 @@ class SAGINOrchestrator:
             'remappings': 0
         }
         
-        # Get slot data to count domains
-        slot_data = self.topology_data['time_slots'][slot - 1]
-        unique_domains = set()
-        
-        for pos in slot_data['node_positions']:
-            domain = pos.get('domain', 0)
-            if domain > 0:
-                unique_domains.add(domain)
+        # Domain counts are computed once per slot, when first needed
+        num_domains = self._num_domains_per_slot.get(slot)
+        if num_domains is None:
+            num_domains = _count_domains(self.topology_data['time_slots'][slot - 1])
+            self._num_domains_per_slot[slot] = num_domains
+        metrics['num_domains'] = num_domains
         
-        metrics['num_domains'] = len(unique_domains)
-        
-        # Get remappings if not first slot
+        # Get remappings into this slot if not first slot. This reads the
+        # memoized diff without advancing the topology manager, which
+        # transition_to_next_slot already did for this slot.
         if slot > 1:
-            changes = self.topology_manager.get_next_slot_changes()
-            if changes:
-                metrics['remappings'] = len(changes.get('remappings', []))
+            changes = self.topology_manager.get_slot_changes(slot - 1, slot)
+            metrics['remappings'] = len(changes.get('remappings', []))
         
         self.metrics.append(metrics)
         
@@ -261,6 +304,7 @@ class SAGINOrchestrator:
         This is the main simulation loop.
         """
         info('=== Starting SAGIN Network Simulation ===\n')
+        self._stop_evt.clear()  # A previous stop() must not end this run
         
         # Start Ryu controller (only for local controller)
         if not self.use_remote:
@@ -276,10 +320,16 @@ class SAGINOrchestrator:
             # Collect initial metrics
             self.collect_metrics(slot=1)
             
-            # Simulate remaining time slots
+            # Simulate remaining time slots on a fixed schedule: slot N starts
+            # at t0 + (N-1) * slot_duration, so per-slot overhead does not drift
+            t0 = time.monotonic()
             for slot in range(2, self.num_slots + 1):
-                info('\nWaiting for slot duration (%d seconds)...\n' % self.slot_duration)
-                time.sleep(self.slot_duration)
+                deadline = t0 + (slot - 1) * self.slot_duration
+                remaining = max(0, deadline - time.monotonic())
+                info('\nWaiting %.1f seconds for slot %d...\n' % (remaining, slot))
+                self._stop_evt.wait(remaining)
+                if self._stop_evt.is_set():
+                    break
                 
                 # Transition to next slot
                 if not self.transition_to_next_slot():
@@ -297,6 +347,10 @@ class SAGINOrchestrator:
             # Clean up
             self.cleanup()
     
+    def stop(self):
+        """Stop the simulation loop without waiting out the current slot."""
+        self._stop_evt.set()
+    
     def cleanup(self):
         """Clean up resources."""
         info('Cleaning up resources...\n')
@@ -308,6 +362,21 @@ class SAGINOrchestrator:
         
         info('Cleanup complete\n')
     
+    def _output_path(self, filename):
+        """
+        Resolve the path for an output file.
+        
+        Args:
+            filename: Output filename
+            
+        Returns:
+            Path in the results directory (Docker environment) if writable,
+            otherwise in the orchestrator directory (local environment)
+        """
+        if self._results_writable:
+            return os.path.join(_RESULTS_DIR, filename)
+        return os.path.join(_HERE, filename)
+    
     def export_metrics(self, filename='simulation_metrics.json'):
         """
         Export collected metrics to JSON file.
@@ -315,20 +384,19 @@ class SAGINOrchestrator:
         Args:
             filename: Output filename
         """
-        # Try to write to results directory first (for Docker), fallback to orchestrator dir
-        results_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'results')
-        if os.path.exists(results_dir) and os.access(results_dir, os.W_OK):
-            # Write to results directory (Docker environment)
-            output_file = os.path.join(results_dir, filename)
-        else:
-            # Write to orchestrator directory (local environment)
-            output_file = os.path.join(os.path.dirname(__file__), filename)
+        output_file = self._output_path(filename)
         
         # Ensure directory exists
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
         
-        with open(output_file, 'w') as f:
-            json.dump(self.metrics, f, indent=2)
+        if orjson is not None:
+            buf = orjson.dumps(self.metrics,
+                               option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            with open(output_file, 'wb') as f:
+                f.write(buf)
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(self.metrics, f, indent=2)
         
         info('Metrics exported to %s\n' % output_file)
         return output_file
@@ -341,13 +409,18 @@ class SAGINOrchestrator:
             info('No metrics collected\n')
             return
         
-        total_remappings = sum(m.get('remappings', 0) for m in self.metrics)
-        avg_domains = sum(m.get('num_domains', 0) for m in self.metrics) / len(self.metrics)
+        # Gather both columns in one pass, then reduce them together
+        num_slots = len(self.metrics)
+        columns = np.fromiter(
+            (v for m in self.metrics
+             for v in (m.get('remappings', 0), m.get('num_domains', 0))),
+            dtype=np.int64, count=2 * num_slots).reshape(num_slots, 2)
+        total_remappings, total_domains = columns.sum(axis=0).tolist()
         
-        info('Total time slots: %d\n' % len(self.metrics))
+        info('Total time slots: %d\n' % num_slots)
         info('Total remappings: %d\n' % total_remappings)
-        info('Average domains per slot: %.2f\n' % avg_domains)
-        info('Average remappings per slot: %.2f\n' % (total_remappings / len(self.metrics) if self.metrics else 0))
+        info('Average domains per slot: %.2f\n' % (total_domains / num_slots))
+        info('Average remappings per slot: %.2f\n' % (total_remappings / num_slots))
     
     def generate_visualizations(self, metrics_file=None):
         """
@@ -358,26 +431,25 @@ class SAGINOrchestrator:
         """
         try:
             # Import visualization module
-            vis_module_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'visualization')
+            vis_module_path = os.path.join(_BASE_DIR, 'visualization')
             if not os.path.exists(vis_module_path):
                 info('Visualization module not found, skipping plot generation\n')
                 return
             
-            sys.path.insert(0, vis_module_path)
+            if vis_module_path not in sys.path:
+                sys.path.insert(0, vis_module_path)
             from visualize_results import SAGINVisualizer
             
             # Determine paths
-            base_dir = os.path.dirname(os.path.dirname(__file__))
-            topology_file = os.path.join(base_dir, 'topology', 'mininet_topology_data.json')
-            plots_dir = os.path.join(base_dir, 'plots')
+            topology_file = os.path.join(_TOPOLOGY_DIR, 'mininet_topology_data.json')
+            plots_dir = os.path.join(_BASE_DIR, 'plots')
             
             # Auto-detect metrics file
             if metrics_file is None:
-                results_dir = os.path.join(base_dir, 'results')
-                if os.path.exists(results_dir):
-                    metrics_file = os.path.join(results_dir, 'simulation_metrics.json')
+                if os.path.exists(_RESULTS_DIR):
+                    metrics_file = os.path.join(_RESULTS_DIR, 'simulation_metrics.json')
                 else:
-                    metrics_file = os.path.join(os.path.dirname(__file__), 'simulation_metrics.json')
+                    metrics_file = os.path.join(_HERE, 'simulation_metrics.json')
             
             # Ensure plots directory exists
             os.makedirs(plots_dir, exist_ok=True)
@@ -391,7 +463,7 @@ class SAGINOrchestrator:
             visualizer = SAGINVisualizer(topology_file)
             
             # Generate plots
-            metrics_path = metrics_file if os.path.isabs(metrics_file) else os.path.join(base_dir, metrics_file)
+            metrics_path = metrics_file if os.path.isabs(metrics_file) else os.path.join(_BASE_DIR, metrics_file)
             visualizer.generate_report(
                 metrics_file=metrics_path,
                 output_dir=plots_dir,
@@ -435,7 +507,7 @@ def main():
     setLogLevel('info')
     
     # Check if topology file exists
-    json_path = os.path.join(os.path.dirname(__file__), '../topology', args.json)
+    json_path = os.path.join(_TOPOLOGY_DIR, args.json)
     if not os.path.exists(json_path):
         error('Topology file not found: %s\n' % json_path)
         error('Please run the MATLAB export script first.\n')
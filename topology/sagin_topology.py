@@ -11,12 +11,223 @@ Author: SAGIN Research Team
 
 import json
 import os
+from collections import OrderedDict
+from collections.abc import Sequence
+import numpy as np
 from mininet.topo import Topo
-from mininet.net import Mininet
-from mininet.node import Controller, OVSSwitch
-from mininet.link import TCLink
 from mininet.log import setLogLevel, info
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib parser
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional: topology files are always loaded eagerly
+    ijson = None
+
+# Topology files at least this large are parsed slot by slot (needs ijson)
+LAZY_LOAD_MIN_BYTES = 64 * 1024 * 1024
+
+# Delay of every intra-domain link (simplified: not yet distance based)
+DEFAULT_LINK_DELAY_MS = 100
+DEFAULT_DELAY_STR = '%dms' % DEFAULT_LINK_DELAY_MS
+
+# Built (switches, links) specs keyed by ((source path, mtime), slot), so
+# rebuilding a slot of an unchanged file skips the spec computation
+_SPEC_CACHE_SIZE = 32
+_spec_cache = OrderedDict()
+
+# Switch names ('s0', 's1', ...) indexed by node ID, grown on demand
+_switch_name_cache = []
+
+
+def _switch_names(count):
+    """
+    Get switch names for node IDs 0..count-1, formatting each only once.
+    
+    Args:
+        count: Number of node IDs needed
+        
+    Returns:
+        List of switch names indexed by node ID (may be longer than count)
+    """
+    start = len(_switch_name_cache)
+    if start < count:
+        _switch_name_cache.extend(['s%d' % i for i in range(start, count)])
+    return _switch_name_cache
+
+
+def _preprocess_slots(topology_data):
+    """
+    Attach per-slot NumPy arrays built from 'node_positions'.
+    
+    Each slot dict gains '_domains', '_controllers' (int32) and '_lat',
+    '_lon' (float64, NaN where absent), indexed by node_id - 1, so
+    per-node scans become array operations. Already processed slots are
+    skipped, so this is safe to call more than once.
+    
+    Args:
+        topology_data: Topology data dictionary (modified in place)
+        
+    Returns:
+        The same topology data dictionary
+    """
+    time_slots = topology_data['time_slots']
+    if isinstance(time_slots, LazyTimeSlots):
+        return topology_data  # Slots are preprocessed as they are parsed
+    
+    for slot in time_slots:
+        _preprocess_slot(slot)
+    
+    return topology_data
+
+
+def _preprocess_slot(slot):
+    """
+    Attach NumPy arrays to a single time slot (see _preprocess_slots).
+    
+    Args:
+        slot: Time slot dictionary (modified in place)
+        
+    Returns:
+        The same time slot dictionary
+    """
+    if '_domains' not in slot:
+        slot.update(_slot_fields(slot['node_positions']))
+    return slot
+
+
+def _slot_fields(positions):
+    """
+    Build the derived per-slot fields from a 'node_positions' list.
+    
+    Args:
+        positions: List of node position dictionaries
+        
+    Returns:
+        Dictionary with '_domains', '_controllers', '_lat', '_lon' arrays
+    """
+    count = len(positions)
+    return {
+        '_domains': np.fromiter(
+            (pos.get('domain', 0) for pos in positions), dtype=np.int32, count=count),
+        '_controllers': np.fromiter(
+            (pos.get('controller', 0) for pos in positions), dtype=np.int32, count=count),
+        '_lat': np.fromiter(
+            (pos.get('latitude', np.nan) for pos in positions), dtype=np.float64, count=count),
+        '_lon': np.fromiter(
+            (pos.get('longitude', np.nan) for pos in positions), dtype=np.float64, count=count),
+    }
+
+
+class LazyTimeSlots(Sequence):
+    """
+    Read-only sequence of time slots parsed on demand from a topology file.
+    
+    Only a few recently used slots are kept in memory. Slots are read with
+    a single forward ijson iterator that stays open between accesses, so
+    visiting the slots in order parses the file once; the file is only
+    re-read from the start when an earlier, uncached slot is requested.
+    """
+    
+    def __init__(self, json_file, num_slots, cache_size=8):
+        """
+        Initialize the lazy slot sequence.
+        
+        Args:
+            json_file: Path to JSON topology file
+            num_slots: Number of entries in the file's 'time_slots' array
+            cache_size: Number of parsed slots to keep in memory
+        """
+        self.json_file = json_file
+        self._num_slots = num_slots
+        self._cache_size = max(cache_size, 2)
+        self._cache = OrderedDict()  # slot index -> preprocessed slot dict
+        self._reader = None  # Forward iterator over the file's slots
+        self._next_index = 0  # Index of the slot self._reader yields next
+    
+    def __len__(self):
+        return self._num_slots
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._num_slots))]
+        
+        if index < 0:
+            index += self._num_slots
+        if not 0 <= index < self._num_slots:
+            raise IndexError('time slot index out of range')
+        
+        if index in self._cache:
+            self._cache.move_to_end(index)
+            return self._cache[index]
+        
+        if self._reader is None or index < self._next_index:
+            self.close()
+            self._reader = self._stream()
+        while self._next_index <= index:
+            slot = next(self._reader)
+            self._remember(self._next_index, slot)
+            self._next_index += 1
+        
+        return self._cache[index]
+    
+    def __iter__(self):
+        for i in range(self._num_slots):
+            yield self[i]
+    
+    def close(self):
+        """Close the file held open by the forward iterator, if any."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        self._next_index = 0
+    
+    def _stream(self):
+        """Yield preprocessed slots from the file in order."""
+        with open(self.json_file, 'rb') as f:
+            for slot in ijson.items(f, 'time_slots.item', use_float=True):
+                yield _preprocess_slot(slot)
+    
+    def _remember(self, index, slot):
+        """Add a slot to the cache, evicting the least recently used."""
+        self._cache[index] = slot
+        self._cache.move_to_end(index)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+
+def _controller_remappings(old_slot_data, new_slot_data, skip_unassigned=False):
+    """
+    Diff controller assignments between two preprocessed time slots.
+    
+    Args:
+        old_slot_data: Previous time slot data
+        new_slot_data: New time slot data
+        skip_unassigned: Ignore nodes with no controller (0) in the old slot
+        
+    Returns:
+        List of remapping dictionaries for the changed nodes only
+    """
+    old_ctrl = old_slot_data['_controllers']
+    new_ctrl = new_slot_data['_controllers']
+    count = min(old_ctrl.size, new_ctrl.size)
+    old_ctrl, new_ctrl = old_ctrl[:count], new_ctrl[:count]
+    
+    mask = old_ctrl != new_ctrl
+    if skip_unassigned:
+        mask &= old_ctrl != 0
+    changed = np.flatnonzero(mask)
+    
+    return [{'node_id': node_idx + 1,  # Convert to 1-indexed
+             'old_controller': old,
+             'new_controller': new}
+            for node_idx, old, new in zip(changed.tolist(),
+                                          old_ctrl[changed].tolist(),
+                                          new_ctrl[changed].tolist())]
+
 
 class SAGINTopology(Topo):
     """
@@ -37,7 +248,7 @@ class SAGINTopology(Topo):
         """
         Topo.__init__(self, **opts)
         
-        self.topology_data = topology_data
+        self.topology_data = _preprocess_slots(topology_data)
         self.current_slot = current_slot
         self.nodes_dict = {}  # Maps node ID to mininet switch name
         self.domains = {}  # Domain information for current slot
@@ -53,19 +264,73 @@ class SAGINTopology(Topo):
         slot_data = self.topology_data['time_slots'][self.current_slot - 1]
         self.domains = slot_data
         
+        # Reuse the spec of an earlier build of this slot from the same,
+        # unmodified file; data not loaded from a file is always built
+        source = self.topology_data.get('_source')
+        key = (source, self.current_slot)
+        spec = _spec_cache.get(key) if source is not None else None
+        if spec is None:
+            spec = self._build_spec(slot_data)
+            if source is not None:
+                _spec_cache[key] = spec
+                if len(_spec_cache) > _SPEC_CACHE_SIZE:
+                    _spec_cache.popitem(last=False)
+        else:
+            _spec_cache.move_to_end(key)
+        
+        switches, links = spec
+        
+        # Add switches and links to topology (bound once for the loops)
+        add_switch = self.addSwitch
+        nodes_dict = self.nodes_dict
+        for node_name, metadata in switches:
+            add_switch(node_name, **metadata)
+            nodes_dict[metadata['node_id']] = node_name
+        
+        add_link = self.addLink
+        for switch1, switch2, params in links:
+            add_link(switch1, switch2, **params)
+    
+    def _build_spec(self, slot_data):
+        """
+        Compute the switches and links for a time slot.
+        
+        Args:
+            slot_data: Current time slot data
+            
+        Returns:
+            (switches, links) tuple of (name, metadata) and
+            (switch1, switch2, link_params) tuples
+        """
+        node_types = [node_type for node_type in ['meo', 'leo', 'ground', 'haps']
+                      if node_type in self.topology_data['nodes']]
+        
+        max_node_id = max((node['id'] for node_type in node_types
+                           for node in self.topology_data['nodes'][node_type]),
+                          default=0)
+        
         # Create switches for each node
-        for node_type in ['meo', 'leo', 'ground', 'haps']:
-            if node_type not in self.topology_data['nodes']:
-                continue
-                
+        switches = []
+        create_switch = self._create_switch
+        switch_names = _switch_names(max_node_id + 1)
+        for node_type in node_types:
             nodes = self.topology_data['nodes'][node_type]
-            for node in nodes:
-                self._create_switch(node, node_type, slot_data)
+            switches.extend([create_switch(node, node_type, slot_data, switch_names)
+                             for node in nodes])
+        
+        # Node IDs are dense, so link creation looks switch names up by list
+        # index (None where a node has no switch); sized for every node ID
+        # and every position index
+        nodes_names = [None] * (max(max_node_id, len(slot_data['node_positions'])) + 1)
+        for node_name, metadata in switches:
+            nodes_names[metadata['node_id']] = node_name
         
         # Create links between nodes
-        self._create_links(slot_data)
+        links = self._create_links(slot_data, nodes_names)
+        
+        return tuple(switches), tuple(links)
     
-    def _create_switch(self, node_data, node_type, slot_data):
+    def _create_switch(self, node_data, node_type, slot_data, switch_names):
         """
         Create a switch for a network node.
         
@@ -73,9 +338,13 @@ class SAGINTopology(Topo):
             node_data: Node information dictionary
             node_type: Type of node ('meo', 'leo', 'ground', 'haps')
             slot_data: Current time slot data
+            switch_names: Switch names indexed by node ID (see _switch_names)
+            
+        Returns:
+            (switch name, metadata) tuple
         """
         node_id = node_data['id']
-        node_name = 's%d' % node_id
+        node_name = switch_names[node_id]
         
         # Find domain and controller for this node
         # Note: node_positions is a list of dictionaries without an 'id' field
@@ -96,11 +365,9 @@ class SAGINTopology(Topo):
             'display_name': node_data.get('name', node_name)  # Renamed to avoid conflict
         }
         
-        # Add switch to topology
-        self.addSwitch(node_name, **metadata)
-        self.nodes_dict[node_id] = node_name
+        return node_name, metadata
     
-    def _create_links(self, slot_data):
+    def _create_links(self, slot_data, nodes_names):
         """
         Create links between nodes based on adjacency.
         
@@ -109,78 +376,47 @@ class SAGINTopology(Topo):
         
         Args:
             slot_data: Current time slot data
+            nodes_names: Switch names indexed by node ID (None if no switch)
+            
+        Returns:
+            List of (switch1, switch2, link_params) tuples
         """
+        links = []
+        
         # For demonstration: create links within domains only
-        domain_groups = {}
+        domain_arr = slot_data['_domains']
         
-        for idx, pos in enumerate(slot_data['node_positions']):
-            domain = pos['domain']
-            node_id = idx + 1  # Convert from 0-indexed to 1-indexed
-            
-            if domain not in domain_groups:
-                domain_groups[domain] = []
-            domain_groups[domain].append(node_id)
+        # Group 1-indexed node IDs by domain with a single stable sort
+        order = np.argsort(domain_arr, kind='stable')
+        domains, starts = np.unique(domain_arr[order], return_index=True)
+        groups = np.split(order + 1, starts[1:])
         
-        # Create mesh within each domain
-        for domain, nodes in domain_groups.items():
-            if domain == 0:  # Skip unassigned nodes
+        # Create mesh within each domain, in order of first appearance
+        for group in np.argsort(order[starts]):
+            if domains[group] == 0:  # Skip unassigned nodes
                 continue
+            
+            nodes = groups[group].tolist()
                 
             # Create links within domain (simplified: minimum spanning tree)
             if len(nodes) > 1:
                 # Connect first node to all others
-                first_node = nodes[0]
-                if first_node not in self.nodes_dict:
+                switch1 = nodes_names[nodes[0]]
+                if switch1 is None:
                     continue
                     
-                switch1 = self.nodes_dict[first_node]
                 for other_node in nodes[1:]:
-                    if other_node not in self.nodes_dict:
+                    switch2 = nodes_names[other_node]
+                    if switch2 is None:
                         continue
-                        
-                    switch2 = self.nodes_dict[other_node]
-                    # Add link with appropriate delay based on distance
-                    delay = self._calculate_link_delay(slot_data, first_node, other_node)
                     
-                    self.addLink(switch1, switch2, 
-                                delay='%dms' % int(delay),
-                                bw=100,  # 100 Mbps
-                                loss=0)
-    
-    def _calculate_link_delay(self, slot_data, node1_id, node2_id):
-        """
-        Calculate link delay based on node positions.
+                    links.append((switch1, switch2,
+                                  # Default delay, see DEFAULT_LINK_DELAY_MS
+                                  {'delay': DEFAULT_DELAY_STR,
+                                   'bw': 100,  # 100 Mbps
+                                   'loss': 0}))
         
-        Args:
-            slot_data: Current time slot data
-            node1_id: First node ID
-            node2_id: Second node ID
-            
-        Returns:
-            Delay in milliseconds
-        """
-        # Simple delay calculation: 10-500ms based on approximate distance
-        # In full implementation, this would use ECEF coordinates
-        
-        # Find nodes in slot data (using 1-indexed node IDs)
-        pos1 = None
-        pos2 = None
-        
-        if 1 <= node1_id <= len(slot_data['node_positions']):
-            pos1 = slot_data['node_positions'][node1_id - 1]
-        if 1 <= node2_id <= len(slot_data['node_positions']):
-            pos2 = slot_data['node_positions'][node2_id - 1]
-        
-        if not pos1 or not pos2:
-            return 100  # Default delay
-        
-        # Use geodetic coordinates if available
-        if 'latitude' in pos1 and 'longitude' in pos1:
-            # Approximate delay based on distance
-            # For satellite networks, RTT is typically 50-300ms
-            return 100  # Simplified: 100ms delay
-        else:
-            return 100  # Default
+        return links
     
     def update_topology(self, new_slot):
         """
@@ -200,27 +436,16 @@ class SAGINTopology(Topo):
             info('Warning: Time slot %d exceeds available slots\n' % new_slot)
             return None
         
+        old_slot_data = self.topology_data['time_slots'][self.current_slot - 1]
+        new_slot_data = self.topology_data['time_slots'][new_slot - 1]
+        
         changes = {
-            'remappings': [],
+            # Find controller remappings
+            'remappings': _controller_remappings(old_slot_data, new_slot_data),
             'new_links': [],
             'removed_links': []
         }
         
-        old_slot_data = self.topology_data['time_slots'][self.current_slot - 1]
-        new_slot_data = self.topology_data['time_slots'][new_slot - 1]
-        
-        # Find controller remappings
-        for i, (old_pos, new_pos) in enumerate(zip(
-                old_slot_data['node_positions'],
-                new_slot_data['node_positions'])):
-            
-            if old_pos['controller'] != new_pos['controller']:
-                changes['remappings'].append({
-                    'node_id': i + 1,  # Convert to 1-indexed
-                    'old_controller': old_pos['controller'],
-                    'new_controller': new_pos['controller']
-                })
-        
         self.current_slot = new_slot
         
         return changes
@@ -234,6 +459,8 @@ class DynamicTopologyManager:
     when transitioning between time slots.
     """
     
+    __slots__ = ('topology_data', 'current_slot', 'remap_count', '_changes_cache')
+    
     def __init__(self, topology_data):
         """
         Initialize the dynamic topology manager.
@@ -241,40 +468,55 @@ class DynamicTopologyManager:
         Args:
             topology_data: Full topology data from JSON
         """
-        self.topology_data = topology_data
+        self.topology_data = _preprocess_slots(topology_data)
         self.current_slot = 1
         self.remap_count = 0
+        self._changes_cache = {}  # (old_slot, new_slot) -> changes
     
-    def get_next_slot_changes(self):
+    def get_slot_changes(self, old_slot, new_slot):
         """
-        Get topology changes for the next time slot.
+        Get topology changes between two time slots.
+        
+        Slot data is static after load, so results are memoized per
+        (old_slot, new_slot) pair; repeated queries are O(1).
         
+        Args:
+            old_slot: Previous time slot number (1-indexed)
+            new_slot: New time slot number (1-indexed)
+            
         Returns:
-            Dictionary with changes, or None if no more slots
+            Dictionary with changes
         """
-        if self.current_slot >= len(self.topology_data['time_slots']):
-            return None
+        key = (old_slot, new_slot)
+        if key in self._changes_cache:
+            return self._changes_cache[key]
         
-        next_slot = self.current_slot + 1
-        
-        old_slot = self.topology_data['time_slots'][self.current_slot - 1]
-        new_slot = self.topology_data['time_slots'][next_slot - 1]
+        old_slot_data = self.topology_data['time_slots'][old_slot - 1]
+        new_slot_data = self.topology_data['time_slots'][new_slot - 1]
         
         changes = {
-            'remappings': [],
+            # Count remappings of previously assigned nodes
+            'remappings': _controller_remappings(old_slot_data, new_slot_data,
+                                                 skip_unassigned=True),
             'new_links': [],
             'removed_links': []
         }
         
-        # Count remappings
-        for i, (old_pos, new_pos) in enumerate(zip(old_slot['node_positions'], 
-                                                     new_slot['node_positions'])):
-            if old_pos['controller'] != new_pos['controller'] and old_pos['controller'] != 0:
-                changes['remappings'].append({
-                    'node_id': i + 1,  # Convert to 1-indexed
-                    'old_controller': old_pos['controller'],
-                    'new_controller': new_pos['controller']
-                })
+        self._changes_cache[key] = changes
+        return changes
+    
+    def get_next_slot_changes(self):
+        """
+        Get topology changes for the next time slot.
+        
+        Returns:
+            Dictionary with changes, or None if no more slots
+        """
+        if self.current_slot >= len(self.topology_data['time_slots']):
+            return None
+        
+        next_slot = self.current_slot + 1
+        changes = self.get_slot_changes(self.current_slot, next_slot)
         
         self.current_slot = next_slot
         return changes
@@ -284,6 +526,43 @@ class DynamicTopologyManager:
         return self.remap_count
 
 
+def _load_topology_lazy(json_file):
+    """
+    Load topology data with 'time_slots' as a LazyTimeSlots sequence.
+    
+    Makes a single ijson pass that builds every other top-level value and
+    only counts the time slots.
+    
+    Args:
+        json_file: Path to JSON topology file
+        
+    Returns:
+        Dictionary with topology data
+    """
+    data = {}
+    num_slots = 0
+    key = None
+    builder = None
+    
+    with open(json_file, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == '':
+                if builder is not None:
+                    data[key] = builder.value
+                    builder = None
+                if event == 'map_key':
+                    key = value
+                    if key != 'time_slots':
+                        builder = ijson.ObjectBuilder()
+            elif builder is not None:
+                builder.event(event, value)
+            elif prefix == 'time_slots.item' and event == 'start_map':
+                num_slots += 1
+    
+    data['time_slots'] = LazyTimeSlots(json_file, num_slots)
+    return data
+
+
 def load_topology_data(json_file):
     """
     Load topology data from JSON file.
@@ -292,15 +571,26 @@ def load_topology_data(json_file):
         json_file: Path to JSON topology file
         
     Returns:
-        Dictionary with topology data
+        Dictionary with topology data. For large files (and with ijson
+        installed) 'time_slots' is a LazyTimeSlots sequence. '_source'
+        holds the file's (absolute path, mtime_ns).
     """
     info('Loading topology data from %s...\n' % json_file)
     
     if not os.path.exists(json_file):
         raise FileNotFoundError('Topology file not found: %s' % json_file)
     
-    with open(json_file, 'r') as f:
-        data = json.load(f)
+    if ijson is not None and os.path.getsize(json_file) >= LAZY_LOAD_MIN_BYTES:
+        data = _load_topology_lazy(json_file)
+    elif orjson is not None:
+        with open(json_file, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(json_file, 'r') as f:
+            data = json.load(f)
+    
+    _preprocess_slots(data)
+    data['_source'] = (os.path.abspath(json_file), os.stat(json_file).st_mtime_ns)
     
     info('Loaded topology with %d time slots, %d nodes\n' % 
          (data['total_slots'], sum(len(data['nodes'][k]) for k in data['nodes'].keys())))
@@ -13,14 +13,487 @@ Author: SAGIN Research Team
 """
 
 import os
+import sys
 import json
+import warnings
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, wraps
+from itertools import islice
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
 import matplotlib.patches as mpatches
+from matplotlib import cm
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
 from matplotlib.animation import FuncAnimation
 # Note: Basemap is deprecated. Using regular matplotlib for visualization.
 import networkx as nx
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib parser
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional: topology files are always parsed in one go
+    ijson = None
+
+_HERE = os.path.dirname(__file__)
+
+# Resolution of saved plots; HI_RES_DPI is used with --hi-res
+DEFAULT_DPI = 150
+HI_RES_DPI = 300
+
+_TOPOLOGY_FIGSIZE = (16, 12)
+
+# Topology files at least this large are parsed slot by slot (needs ijson);
+# keep in sync with LAZY_LOAD_MIN_BYTES in topology/sagin_topology.py
+STREAM_LOAD_MIN_BYTES = 64 * 1024 * 1024
+
+# Node type names, sorted so np.searchsorted can map them to integer codes;
+# unrecognized types get code len(_NODE_TYPES)
+_NODE_TYPES = np.array(sorted(['SN_MEO', 'SN_LEO', 'TN_GRO', 'AN_HAPS']))
+
+
+# Shared text and grid style of the report plots, applied by @_styled
+_PLOT_STYLE = {
+    'axes.titlesize': 14,
+    'axes.titleweight': 'bold',
+    'axes.labelsize': 12,
+    'axes.labelweight': 'bold',
+    'legend.fontsize': 10,
+    'grid.alpha': 0.3,
+}
+
+# matplotlib.pyplot is slow to import, so it is only loaded by _plt() once a
+# plot is actually drawn
+plt = None
+
+
+def _plt():
+    """
+    Import matplotlib.pyplot on first use.
+    
+    Returns:
+        The matplotlib.pyplot module, also bound to the module-level plt
+    """
+    global plt
+    if plt is None:
+        import matplotlib.pyplot as plt
+    return plt
+
+
+def _use_file_backend():
+    """
+    Select the non-interactive Agg backend for plots that are only saved.
+    
+    Has no effect once pyplot is loaded anywhere in the process, so a
+    backend the caller is already using is left alone.
+    """
+    if 'matplotlib.pyplot' not in sys.modules:
+        matplotlib.use('Agg')
+
+
+def _styled(method):
+    """
+    Run a plot method with _PLOT_STYLE applied.
+    
+    The style is set with matplotlib.rc_context, so the caller's rcParams
+    are restored when the method returns.
+    """
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        with matplotlib.rc_context(_PLOT_STYLE):
+            return method(*args, **kwargs)
+    return wrapper
+
+
+@lru_cache(maxsize=8)
+def _load_json_cached(path, mtime_ns):
+    """
+    Parse a JSON file, memoized on (path, mtime).
+    
+    The modification time is part of the key so a rewritten file is
+    parsed again. Callers must treat the result as read-only, since it
+    is shared between them.
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _load_json(path):
+    """Load a JSON file through the (path, mtime) cache."""
+    path = os.path.abspath(path)
+    return _load_json_cached(path, os.stat(path).st_mtime_ns)
+
+
+def _slot_arrays(positions):
+    """
+    Convert a slot's node_positions list into per-field NumPy columns.
+    
+    Args:
+        positions: List of node position dicts for one time slot
+        
+    Returns:
+        Dict of equal-length arrays: 'lon', 'lat' (NaN where missing),
+        'domain', 'ctrl_id' and 'type_code' (index into _NODE_TYPES)
+    """
+    count = len(positions)
+    types = np.array([pos.get('type', '') for pos in positions], dtype=str)
+    type_code = np.searchsorted(_NODE_TYPES, types)
+    known = np.zeros(count, dtype=bool)
+    in_range = type_code < len(_NODE_TYPES)
+    known[in_range] = _NODE_TYPES[type_code[in_range]] == types[in_range]
+    type_code[~known] = len(_NODE_TYPES)
+    
+    return {
+        'lon': np.fromiter((pos.get('longitude', np.nan) for pos in positions),
+                           dtype=np.float64, count=count),
+        'lat': np.fromiter((pos.get('latitude', np.nan) for pos in positions),
+                           dtype=np.float64, count=count),
+        'domain': np.fromiter((pos.get('domain', 0) for pos in positions),
+                              dtype=np.int64, count=count),
+        'ctrl_id': np.fromiter((pos.get('controller', 0) for pos in positions),
+                               dtype=np.int64, count=count),
+        'type_code': type_code,
+    }
+
+
+# Node count above which generate_report draws topology snapshots as a 2D
+# histogram, and the number of slot buckets used when max_slots is exceeded
+DENSE_PLOT_MAX_POINTS = 5000
+DENSE_PLOT_BUCKETS = 50
+
+class _StreamedTimeSlots(Sequence):
+    """
+    Read-only sequence of a topology file's time slots, parsed on access.
+    
+    Slots are read with one forward ijson iterator that stays open between
+    lookups, so visiting them in order parses the file once; the file is
+    only re-read from the start for an earlier slot. Only the last slot
+    read is held in memory.
+    """
+    
+    def __init__(self, path, num_slots):
+        self._path = path
+        self._num_slots = num_slots
+        self._last = (None, None)
+        self._reader = None  # Forward iterator over the file's slots
+        self._next_index = 0  # Index of the slot self._reader yields next
+    
+    def __len__(self):
+        return self._num_slots
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._num_slots))]
+        if index < 0:
+            index += self._num_slots
+        if not 0 <= index < self._num_slots:
+            raise IndexError('time slot index out of range')
+        
+        if self._last[0] != index:
+            if self._reader is None or index < self._next_index:
+                self.close()
+                self._reader = self._stream()
+            slot = next(islice(self._reader, index - self._next_index, None))
+            self._next_index = index + 1
+            self._last = (index, slot)
+        return self._last[1]
+    
+    def __iter__(self):
+        for i in range(self._num_slots):
+            yield self[i]
+    
+    def _stream(self):
+        """Yield the file's slots in order."""
+        with open(self._path, 'rb') as f:
+            yield from ijson.items(f, 'time_slots.item', use_float=True)
+    
+    def close(self):
+        """Close the file held open by the forward iterator, if any."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        self._next_index = 0
+
+
+def _load_topology_streamed(path, build_arrays=True):
+    """
+    Load a topology file in one ijson pass without decoding it as a whole.
+    
+    Top-level values other than 'time_slots' are built normally. Each time
+    slot is built on its own, converted to node arrays and then dropped, so
+    peak memory is about one slot.
+    
+    Args:
+        path: Path to JSON topology file
+        build_arrays: Convert slots with _slot_arrays (otherwise only count them)
+        
+    Returns:
+        Tuple of (topology data with 'time_slots' as a _StreamedTimeSlots,
+        list of per-slot node arrays or None)
+    """
+    data = {}
+    slot_arrays = [] if build_arrays else None
+    num_slots = 0
+    key = None
+    builder = None
+    slot_builder = None
+    
+    with open(path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == '':
+                if builder is not None:
+                    data[key] = builder.value
+                    builder = None
+                if event == 'map_key':
+                    key = value
+                    if key != 'time_slots':
+                        builder = ijson.ObjectBuilder()
+            elif builder is not None:
+                builder.event(event, value)
+            elif prefix == 'time_slots.item' and event == 'start_map':
+                num_slots += 1
+                if build_arrays:
+                    slot_builder = ijson.ObjectBuilder()
+                    slot_builder.event(event, value)
+            elif slot_builder is not None:
+                slot_builder.event(event, value)
+                if prefix == 'time_slots.item' and event == 'end_map':
+                    slot_arrays.append(_slot_arrays(slot_builder.value.get('node_positions', [])))
+                    slot_builder = None
+    
+    data['time_slots'] = _StreamedTimeSlots(path, num_slots)
+    return data, slot_arrays
+
+
+_SLOT_ARRAY_FIELDS = ('lon', 'lat', 'domain', 'ctrl_id', 'type_code')
+
+
+def _save_slot_arrays(path, slot_arrays):
+    """
+    Write per-slot node arrays to a compressed .npz cache.
+    
+    Each field is stored as one array concatenated over all slots, with
+    'offsets' marking where every slot starts and ends.
+    
+    Args:
+        path: Cache file path
+        slot_arrays: List of per-slot dicts from _slot_arrays
+    """
+    offsets = np.zeros(len(slot_arrays) + 1, dtype=np.int64)
+    np.cumsum([len(arrays['lon']) for arrays in slot_arrays], out=offsets[1:])
+    columns = {field: np.concatenate([arrays[field] for arrays in slot_arrays])
+               for field in _SLOT_ARRAY_FIELDS}
+    
+    # Write to a temporary file first so readers never see a partial cache
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            np.savez_compressed(f, offsets=offsets, node_types=_NODE_TYPES, **columns)
+        os.replace(tmp_path, path)
+    except Exception:
+        # Do not leave a partial cache behind (e.g. disk full)
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _load_slot_arrays(path, source_path):
+    """
+    Read per-slot node arrays from a .npz cache written by _save_slot_arrays.
+    
+    Args:
+        path: Cache file path
+        source_path: JSON file the cache was built from
+        
+    Returns:
+        List of per-slot dicts, or None if the cache is missing, older than
+        the source file or unreadable
+    """
+    try:
+        if os.stat(path).st_mtime_ns < os.stat(source_path).st_mtime_ns:
+            return None
+        with np.load(path) as data:
+            if not np.array_equal(data['node_types'], _NODE_TYPES):
+                return None
+            offsets = data['offsets']
+            columns = {field: data[field] for field in _SLOT_ARRAY_FIELDS}
+    except (OSError, KeyError, ValueError):
+        return None
+    
+    return [{field: columns[field][start:end] for field in _SLOT_ARRAY_FIELDS}
+            for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+
+
+def _domain_rgba(domain, domain_colors):
+    """
+    Map domain IDs to RGBA colors (gray for unassigned nodes).
+    
+    Args:
+        domain: Array of domain IDs
+        domain_colors: (K, 4) color table indexed by domain ID modulo K
+        
+    Returns:
+        (N, 4) array of RGBA colors
+    """
+    colors = domain_colors[domain % len(domain_colors)]
+    colors[domain == 0] = to_rgba('gray')
+    return colors
+
+
+def _prepare_panel(arrays, domain_colors):
+    """
+    Split one slot's nodes into the point sets of a controller-evolution panel.
+    
+    Kept free of matplotlib state so panels can be prepared in worker processes.
+    
+    Args:
+        arrays: Per-slot node arrays from _slot_arrays
+        domain_colors: Color table passed to _domain_rgba
+        
+    Returns:
+        Dict mapping 'nodes' and 'controllers' to (lon, lat, colors) tuples
+    """
+    lon, lat = arrays['lon'], arrays['lat']
+    valid = ~(np.isnan(lon) | np.isnan(lat))
+    is_controller = (np.arange(len(lon)) + 1) == arrays['ctrl_id']
+    colors = _domain_rgba(arrays['domain'], domain_colors)
+    
+    panel = {}
+    for key, mask in (('nodes', valid & ~is_controller), ('controllers', valid & is_controller)):
+        panel[key] = (lon[mask], lat[mask], colors[mask])
+    return panel
+
+
+def _bucket_slots(slots, columns, num_buckets=DENSE_PLOT_BUCKETS, mean=False):
+    """
+    Aggregate per-slot values into contiguous buckets of slots.
+    
+    Args:
+        slots: Slot numbers, one per column
+        columns: (K, N) array of per-slot values
+        num_buckets: Number of buckets to produce (at most N)
+        mean: Average within each bucket instead of summing
+        
+    Returns:
+        Tuple of (first slot of each bucket, (K, num_buckets) aggregated values)
+    """
+    count = len(slots)
+    starts = np.unique(np.linspace(0, count, num_buckets, endpoint=False).astype(np.int64))
+    values = np.add.reduceat(np.asarray(columns, dtype=np.float64), starts, axis=1)
+    if mean:
+        values /= np.diff(np.r_[starts, count])
+    return np.asarray(slots)[starts], values
+
+
+def _fill_band(ax, x, lower, upper, **kwargs):
+    """
+    Shade the area between two curves as a single PolyCollection.
+    
+    Args:
+        ax: Axes to draw on
+        x: X coordinates
+        lower: Lower curve (scalar or array)
+        upper: Upper curve
+        **kwargs: PolyCollection properties (color, alpha, label, ...)
+        
+    Returns:
+        The added PolyCollection
+    """
+    x = np.asarray(x, dtype=np.float64)
+    upper = np.asarray(upper, dtype=np.float64)
+    lower = np.broadcast_to(np.asarray(lower, dtype=np.float64), upper.shape)
+    verts = np.column_stack([np.r_[x, x[::-1]], np.r_[upper, lower[::-1]]])
+    collection = PolyCollection([verts], **kwargs)
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
+
+
+def _bar_collection(ax, x, heights, width=0.8, **kwargs):
+    """
+    Draw a bar chart as one PolyCollection of rectangles.
+    
+    Args:
+        ax: Axes to draw on
+        x: Bar centers
+        heights: Bar heights (negative values extend below zero)
+        width: Bar width
+        **kwargs: PolyCollection properties (facecolor, alpha, ...)
+        
+    Returns:
+        The added PolyCollection
+    """
+    x = np.asarray(x, dtype=np.float64)
+    heights = np.asarray(heights, dtype=np.float64)
+    verts = np.zeros((len(x), 4, 2))
+    verts[:, :2, 0] = (x - width / 2)[:, None]
+    verts[:, 2:, 0] = (x + width / 2)[:, None]
+    verts[:, 1:3, 1] = heights[:, None]
+    collection = PolyCollection(verts, **kwargs)
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
+
+
+def _resolve_path(name, search_dirs):
+    """
+    Find a file as given, or relative to each search directory in turn.
+    
+    Args:
+        name: File path or name
+        search_dirs: Directories to try after name itself
+        
+    Returns:
+        First existing path, or None if not found
+    """
+    for path in [name] + [os.path.join(d, name) for d in search_dirs]:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+# Visualizer shared by the report worker processes (see _init_plot_worker)
+_worker_visualizer = None
+
+
+def _init_plot_worker(visualizer):
+    """
+    Initialize a report worker process.
+    
+    Args:
+        visualizer: SAGINVisualizer to render with, sent once per worker
+    """
+    global _worker_visualizer
+    _use_file_backend()
+    _worker_visualizer = visualizer
+
+
+def _run_plot_task(task):
+    """
+    Render one report plot in a worker process.
+    
+    Args:
+        task: (method name, keyword arguments, optional) tuple
+    """
+    method, kwargs, _ = task
+    _plt()
+    try:
+        getattr(_worker_visualizer, method)(**kwargs)
+    finally:
+        plt.close('all')
+
 
 class SAGINVisualizer:
     """
@@ -34,11 +507,14 @@ class SAGINVisualizer:
         Args:
             json_file: Path to topology JSON file
         """
-        self.topology_data = None
+        self._topology_data = None
+        self._topology_path = None
+        self._streamed = False
+        self._path_cache = {}
         self.load_topology_data(json_file)
         
         # Color schemes
-        self.domain_colors = plt.cm.Set3(np.linspace(0, 1, 12))
+        self.domain_colors = cm.Set3(np.linspace(0, 1, 12))
         self.node_colors = {
             'SN_MEO': 'red',
             'SN_LEO': 'blue',
@@ -51,23 +527,110 @@ class SAGINVisualizer:
             'TN_GRO': 'o',
             'AN_HAPS': 'D'
         }
+        
+        # Legend proxies for node types are the same in every topology plot;
+        # legend() copies their style, so one set is shared across figures
+        self._marker_legend = [
+            Line2D([0], [0], marker=marker, color='w', markerfacecolor='black',
+                   markersize=8, label=label, markeredgewidth=1)
+            for label, marker in [
+                ('MEO', self.node_markers['SN_MEO']),
+                ('LEO', self.node_markers['SN_LEO']),
+                ('Ground', self.node_markers['TN_GRO']),
+                ('HAPS', self.node_markers['AN_HAPS']),
+                ('Controller', 'o')
+            ]
+        ]
+    
+    def _resolve(self, name, search_dirs):
+        """
+        Resolve a data file path, remembering where it was found.
+        
+        Args:
+            name: File path or name
+            search_dirs: Directories to try after name itself
+            
+        Returns:
+            Resolved path, or None if not found
+        """
+        key = (name, tuple(search_dirs))
+        path = self._path_cache.get(key)
+        if path is None:
+            path = _resolve_path(name, search_dirs)
+            if path is not None:
+                self._path_cache[key] = path
+        return path
+    
+    def __getstate__(self):
+        # Report workers only need the node arrays; the parsed JSON is
+        # reloaded on demand instead of being pickled
+        state = self.__dict__.copy()
+        state['_topology_data'] = None
+        return state
+    
+    @property
+    def topology_data(self):
+        """
+        Parsed topology JSON, loaded on first access.
+        
+        For files of at least STREAM_LOAD_MIN_BYTES (with ijson installed),
+        'time_slots' is a read-only sequence that parses slots on access
+        rather than a list.
+        """
+        if self._topology_data is None:
+            if self._streamed:
+                self._topology_data, _ = _load_topology_streamed(self._topology_path,
+                                                                 build_arrays=False)
+            else:
+                self._topology_data = _load_json(self._topology_path)
+        return self._topology_data
     
     def load_topology_data(self, json_file):
-        """Load topology data from JSON file."""
-        if os.path.exists(json_file):
-            with open(json_file, 'r') as f:
-                self.topology_data = json.load(f)
-        else:
-            # Try relative path
-            json_path = os.path.join(os.path.dirname(__file__), 
-                                    '../topology', json_file)
-            if os.path.exists(json_path):
-                with open(json_path, 'r') as f:
-                    self.topology_data = json.load(f)
+        """
+        Load topology data from JSON file.
+        
+        The per-slot node arrays are cached in a .npz file next to the JSON
+        file; while that cache is up to date the JSON itself is not parsed.
+        """
+        # Try the path as given, then relative to the topology directory
+        json_path = self._resolve(json_file, [os.path.join(_HERE, '../topology')])
+        if json_path is None:
+            raise FileNotFoundError(f'Topology file not found: {json_file}')
+        
+        self._topology_path = json_path
+        self._topology_data = None
+        self._streamed = (ijson is not None
+                          and os.path.getsize(json_path) >= STREAM_LOAD_MIN_BYTES)
+        
+        cache_path = json_path + '.npz'
+        self._slot_arrays = _load_slot_arrays(cache_path, json_path)
+        if self._slot_arrays is None:
+            if self._streamed:
+                self._topology_data, self._slot_arrays = _load_topology_streamed(json_path)
             else:
-                raise FileNotFoundError('Topology file not found: %s' % json_file)
+                self._slot_arrays = [_slot_arrays(slot_data['node_positions'])
+                                     for slot_data in self.topology_data['time_slots']]
+            if self._slot_arrays:
+                try:
+                    _save_slot_arrays(cache_path, self._slot_arrays)
+                except OSError as e:
+                    print(f'Warning: Could not write topology cache {cache_path}: {e}')
+        self._num_slots = len(self._slot_arrays)
+        
+        # Slots 1, 8, 15, 22 for the evolution plot, or as many as exist
+        num_slots = self._num_slots
+        if num_slots >= 22:
+            self._default_evolution_slots = [1, 8, 15, 22]
+        elif num_slots >= 15:
+            self._default_evolution_slots = [1, 8, 15, num_slots]
+        elif num_slots >= 8:
+            self._default_evolution_slots = [1, 8, num_slots, num_slots]
+        else:
+            self._default_evolution_slots = list(range(1, min(5, num_slots + 1)))
     
-    def plot_topology(self, slot=1, output_file=None, show_map=True):
+    @_styled
+    def plot_topology(self, slot=1, output_file=None, show_map=True, max_points=None,
+                      dpi=DEFAULT_DPI, ax=None):
         """
         Plot network topology for a specific time slot.
         
@@ -75,16 +638,30 @@ class SAGINVisualizer:
             slot: Time slot number (1-indexed)
             output_file: Output filename (optional)
             show_map: Whether to show geographic map
+            max_points: Draw a 2D density histogram instead of individual
+                nodes when more nodes than this are present (optional)
+            dpi: Resolution of saved images (default: DEFAULT_DPI)
+            ax: Axes to draw into, cleared first; its figure is reused
+                instead of creating a new one (optional)
         """
-        if slot > len(self.topology_data['time_slots']):
-            raise ValueError('Time slot %d exceeds available slots' % slot)
+        _plt()
+        if slot > self._num_slots:
+            raise ValueError(f'Time slot {slot} exceeds available slots')
         
-        slot_data = self.topology_data['time_slots'][slot - 1]
+        arrays = self._slot_arrays[slot - 1]
         
-        fig = plt.figure(figsize=(16, 12))
-        
-        # Create plot (Basemap removed - use simple scatter plot)
-        ax = fig.add_subplot(111)
+        if ax is None:
+            fig = plt.figure(figsize=_TOPOLOGY_FIGSIZE, constrained_layout=True)
+            
+            # Create plot (Basemap removed - use simple scatter plot)
+            ax = fig.add_subplot(111)
+        else:
+            # Reused from a previous slot: drop its artists and any colorbar
+            fig = ax.figure
+            for other in fig.axes:
+                if other is not ax:
+                    other.remove()
+            ax.clear()
         
         if show_map:
             # Simple background for world map
@@ -93,97 +670,111 @@ class SAGINVisualizer:
             ax.set_ylim(-90, 90)
             ax.set_xlabel('Longitude (°)')
             ax.set_ylabel('Latitude (°)')
-            ax.grid(True, alpha=0.3)
+            ax.grid(True)
             ax.set_aspect('equal', adjustable='box')
         else:
             # No special map projection
             pass
         
-        # Plot nodes by domain
-        domain_groups = {}
-        
-        for idx, pos in enumerate(slot_data['node_positions']):
-            node_type = pos.get('type', 'UNKNOWN')
-            domain = pos.get('domain', 0)
-            controller_id = pos.get('controller', 0)
-            is_controller = (idx + 1 == controller_id)
+        # Keep nodes with coordinates; lat/lon are plotted directly (no projection)
+        lon, lat = arrays['lon'], arrays['lat']
+        valid = ~(np.isnan(lon) | np.isnan(lat))
+        domain = arrays['domain'][valid]
+        is_controller = (np.flatnonzero(valid) + 1) == arrays['ctrl_id'][valid]
+        lon, lat = lon[valid], lat[valid]
+        colors = _domain_rgba(domain, self.domain_colors)
+        sizes = np.where(is_controller, 225, 100)  # markersize 15 / 10
+        widths = np.where(is_controller, 1.5, 0.5)
+        
+        if max_points is not None and len(lon) > max_points:
+            # Too many nodes to scatter individually: bin them on a 2° grid
+            # and mark only the controllers on top
+            _, _, _, image = ax.hist2d(lon, lat, bins=(180, 90),
+                                       range=[[-180, 180], [-90, 90]],
+                                       cmin=1, cmap='viridis', zorder=2)
+            fig.colorbar(image, ax=ax, label='Nodes per bin')
+            ax.scatter(lon[is_controller], lat[is_controller], c=colors[is_controller],
+                       s=225, marker='*', edgecolors='black', linewidths=1.5, zorder=3)
+            ax.set_title(f'SAGIN Network Topology - Time Slot {slot} ({len(lon)} nodes)')
             
-            # Get coordinates
-            if 'latitude' in pos and 'longitude' in pos:
-                lat, lon = pos['latitude'], pos['longitude']
+            if output_file:
+                fig.savefig(output_file, dpi=dpi)
+                print(f'Saved topology plot to {output_file}')
             else:
-                continue
-            
-            # Group by domain
-            if domain not in domain_groups:
-                domain_groups[domain] = []
-            domain_groups[domain].append((lon, lat, node_type, is_controller))
-        
-        # Plot each domain
-        for domain_id, nodes in domain_groups.items():
-            if domain_id == 0:  # Unassigned nodes
-                color = 'gray'
-            else:
-                color = self.domain_colors[domain_id % len(self.domain_colors)]
-            
-            for lon, lat, node_type, is_controller in nodes:
-                # Use lat/lon directly (no projection needed)
-                x, y = lon, lat
-                
-                marker = self.node_markers.get(node_type, 'o')
-                markersize = 15 if is_controller else 10
-                
-                ax.plot(x, y, marker=marker, color=color, markersize=markersize,
-                       markeredgecolor='black', markeredgewidth=1.5 if is_controller else 0.5)
+                plt.show()
+            return
+        
+        # One scatter per marker shape
+        type_markers = np.array([self.node_markers.get(t, 'o') for t in _NODE_TYPES] + ['o'])
+        node_markers = type_markers[arrays['type_code'][valid]]
+        for marker in dict.fromkeys(node_markers):
+            mask = node_markers == marker
+            ax.scatter(lon[mask], lat[mask], c=colors[mask], s=sizes[mask],
+                       marker=marker, edgecolors='black', linewidths=widths[mask],
+                       zorder=2, rasterized=True)
+        domains = np.unique(domain)
         
         # Add legend
         legend_elements = [
-            mpatches.Patch(facecolor=color, alpha=0.5, label='Domain %d' % d)
-            for d, color in enumerate(self.domain_colors[:len(domain_groups.keys())])
+            mpatches.Patch(facecolor=color, alpha=0.5, label=f'Domain {d}')
+            for d, color in enumerate(self.domain_colors[:len(domains)])
         ]
-        legend_elements.extend([
-            plt.Line2D([0], [0], marker=marker, color='w', markerfacecolor='black',
-                      markersize=8, label=label, markeredgewidth=1)
-            for label, marker in [
-                ('MEO', self.node_markers['SN_MEO']),
-                ('LEO', self.node_markers['SN_LEO']),
-                ('Ground', self.node_markers['TN_GRO']),
-                ('HAPS', self.node_markers['AN_HAPS']),
-                ('Controller', 'o')
-            ]
-        ])
+        legend_elements.extend(self._marker_legend)
         
         ax.legend(handles=legend_elements, loc='lower left', fontsize=9)
-        ax.set_title('SAGIN Network Topology - Time Slot %d' % slot, fontsize=14, fontweight='bold')
-        
-        plt.tight_layout()
+        ax.set_title(f'SAGIN Network Topology - Time Slot {slot}')
         
         if output_file:
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
-            print('Saved topology plot to %s' % output_file)
+            fig.savefig(output_file, dpi=dpi)
+            print(f'Saved topology plot to {output_file}')
         else:
             plt.show()
     
+    @_styled
+    def _plot_topology_series(self, slots, output_dir, max_points=None, dpi=DEFAULT_DPI):
+        """
+        Save topology plots for several slots, reusing a single figure.
+        
+        Args:
+            slots: Time slot numbers (1-indexed)
+            output_dir: Directory for the topology_slot_<n>.png files
+            max_points: Passed to plot_topology (optional)
+            dpi: Resolution of saved images (default: DEFAULT_DPI)
+        """
+        _plt()
+        fig = plt.figure(figsize=_TOPOLOGY_FIGSIZE, constrained_layout=True)
+        ax = fig.add_subplot(111)
+        join = os.path.join
+        plot_topology = self.plot_topology
+        try:
+            for slot in slots:
+                output_file = join(output_dir, f'topology_slot_{slot}.png')
+                plot_topology(slot, output_file, show_map=True, max_points=max_points,
+                              dpi=dpi, ax=ax)
+        finally:
+            plt.close(fig)
+    
+    @_styled
     def plot_remapping_statistics(self, metrics_file='simulation_metrics.json', 
-                                  output_file=None):
+                                  output_file=None, metrics=None, dpi=DEFAULT_DPI):
         """
         Plot remapping statistics over time.
         
         Args:
             metrics_file: Path to simulation metrics JSON file
             output_file: Output filename (optional)
+            metrics: Already-loaded simulation metrics; metrics_file is
+                not read when given (optional)
+            dpi: Resolution of saved images (default: DEFAULT_DPI)
         """
+        _plt()
         # Load metrics
-        if os.path.exists(metrics_file):
-            with open(metrics_file, 'r') as f:
-                metrics = json.load(f)
-        else:
-            metrics_file = os.path.join(os.path.dirname(__file__), metrics_file)
-            if os.path.exists(metrics_file):
-                with open(metrics_file, 'r') as f:
-                    metrics = json.load(f)
-            else:
+        if metrics is None:
+            metrics_path = self._resolve(metrics_file, [_HERE])
+            if metrics_path is None:
                 raise FileNotFoundError('Metrics file not found')
+            
+            metrics = _load_json(metrics_path)
         
         # Extract data
         slots = [m['slot'] for m in metrics]
@@ -191,116 +782,96 @@ class SAGINVisualizer:
         num_domains = [m.get('num_domains', 0) for m in metrics]
         
         # Create figure
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), sharex=True)
+        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), sharex=True, constrained_layout=True)
         
         # Plot remappings over time
         ax1.plot(slots, remappings, marker='o', linewidth=2, markersize=8, color='blue')
-        ax1.fill_between(slots, remappings, alpha=0.3, color='blue')
-        ax1.set_ylabel('Number of Remappings', fontsize=12)
-        ax1.set_title('Controller Remappings Over Time', fontsize=14, fontweight='bold')
-        ax1.grid(True, alpha=0.3)
+        _fill_band(ax1, slots, 0, remappings, alpha=0.3, color='blue')
+        ax1.set_ylabel('Number of Remappings')
+        ax1.set_title('Controller Remappings Over Time')
+        ax1.grid(True)
         
         # Plot number of domains
         ax2.plot(slots, num_domains, marker='s', linewidth=2, markersize=8, color='green')
-        ax2.fill_between(slots, num_domains, alpha=0.3, color='green')
-        ax2.set_xlabel('Time Slot', fontsize=12)
-        ax2.set_ylabel('Number of Domains', fontsize=12)
-        ax2.set_title('Domain Evolution', fontsize=14, fontweight='bold')
-        ax2.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
+        _fill_band(ax2, slots, 0, num_domains, alpha=0.3, color='green')
+        ax2.set_xlabel('Time Slot')
+        ax2.set_ylabel('Number of Domains')
+        ax2.set_title('Domain Evolution')
+        ax2.grid(True)
         
         if output_file:
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
-            print('Saved remapping statistics to %s' % output_file)
+            plt.savefig(output_file, dpi=dpi)
+            print(f'Saved remapping statistics to {output_file}')
         else:
             plt.show()
     
-    def plot_controller_evolution(self, output_file=None, slots=None):
+    @_styled
+    def plot_controller_evolution(self, output_file=None, slots=None, parallel=False,
+                                  dpi=DEFAULT_DPI):
         """
         Plot controller placement evolution across time slots.
         
         Args:
             output_file: Output filename (optional)
             slots: List of slots to plot (default: [1, 8, 15, 22] or first 4)
+            parallel: Prepare the panels' point data in worker processes;
+                drawing always happens in this process
+            dpi: Resolution of saved images (default: DEFAULT_DPI)
         """
-        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+        _plt()
+        fig, axes = plt.subplots(2, 2, figsize=(16, 12), constrained_layout=True)
         axes = axes.flatten()
         
-        # Default to slots 1, 8, 15, 22 or first 4 if not enough slots
         if slots is None:
-            num_slots = len(self.topology_data['time_slots'])
-            if num_slots >= 22:
-                slots = [1, 8, 15, 22]
-            elif num_slots >= 15:
-                slots = [1, 8, 15, num_slots]
-            elif num_slots >= 8:
-                slots = [1, 8, num_slots, num_slots]
-            else:
-                slots = list(range(1, min(5, num_slots + 1)))
+            slots = self._default_evolution_slots
         
-        # Plot topology for selected slots
+        # Up to four panels, stopping at the first slot that does not exist
+        panel_slots = []
         for idx, slot in enumerate(slots):
-            if idx >= 4 or slot > len(self.topology_data['time_slots']):
+            if idx >= 4 or slot > self._num_slots:
                 break
+            panel_slots.append(slot)
+        panel_arrays = [self._slot_arrays[slot - 1] for slot in panel_slots]
+        
+        panels = None
+        if parallel and len(panel_arrays) > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=len(panel_arrays)) as executor:
+                    panels = list(executor.map(_prepare_panel, panel_arrays,
+                                               [self.domain_colors] * len(panel_arrays)))
+            except (OSError, BrokenProcessPool) as e:
+                print(f'Warning: Parallel panel preparation failed ({e}), continuing serially')
+        if panels is None:
+            panels = [_prepare_panel(arrays, self.domain_colors) for arrays in panel_arrays]
+        
+        # Plot topology for selected slots
+        for ax, slot, panel in zip(axes, panel_slots, panels):
+            # Create simple scatter plot (no map for multiple plots);
+            # all nodes, then all controllers, with per-point RGBA colors
+            lon, lat, colors = panel['nodes']
+            if lon.size:
+                ax.scatter(lon, lat, c=colors, s=30, alpha=0.5, rasterized=True)
             
-            ax = axes[idx]
-            slot_data = self.topology_data['time_slots'][slot - 1]
-            
-            # Create simple scatter plot (no map for multiple plots)
-            domain_groups = {}
-            
-            for pos_idx, pos in enumerate(slot_data['node_positions']):
-                if 'latitude' not in pos or 'longitude' not in pos:
-                    continue
-                
-                domain = pos.get('domain', 0)
-                controller_id = pos.get('controller', 0)
-                is_controller = (pos_idx + 1 == controller_id)
-                
-                if domain not in domain_groups:
-                    domain_groups[domain] = {'nodes': [], 'controllers': []}
-                
-                if is_controller:
-                    domain_groups[domain]['controllers'].append(
-                        (pos['longitude'], pos['latitude'])
-                    )
-                else:
-                    domain_groups[domain]['nodes'].append(
-                        (pos['longitude'], pos['latitude'])
-                    )
-            
-            # Plot nodes
-            for domain_id, group in domain_groups.items():
-                if domain_id == 0:
-                    color = 'gray'
-                else:
-                    color = self.domain_colors[domain_id % len(self.domain_colors)]
-                
-                if group['nodes']:
-                    lons, lats = zip(*group['nodes'])
-                    ax.scatter(lons, lats, c=[color], s=30, alpha=0.5)
-                
-                if group['controllers']:
-                    lons, lats = zip(*group['controllers'])
-                    ax.scatter(lons, lats, c=[color], s=200, marker='*', 
-                             edgecolors='black', linewidths=2)
+            lon, lat, colors = panel['controllers']
+            if lon.size:
+                ax.scatter(lon, lat, c=colors, s=200, marker='*', 
+                         edgecolors='black', linewidths=2, rasterized=True)
             
-            ax.set_title('Time Slot %d' % slot, fontsize=12, fontweight='bold')
+            ax.set_title(f'Time Slot {slot}', fontsize=12)
             ax.set_xlabel('Longitude')
             ax.set_ylabel('Latitude')
-            ax.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
+            ax.grid(True)
         
         if output_file:
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
-            print('Saved controller evolution to %s' % output_file)
+            plt.savefig(output_file, dpi=dpi)
+            print(f'Saved controller evolution to {output_file}')
         else:
             plt.show()
     
+    @_styled
     def plot_flow_setup_latency_breakdown(self, emulation_metrics_file='emulation_metrics.json',
-                                          output_file=None, num_slots=25):
+                                          output_file=None, num_slots=25, max_slots=None,
+                                          metrics=None, dpi=DEFAULT_DPI):
         """
         Plot 1: Empirical Breakdown of Mean Flow Setup Latency
         
@@ -315,18 +886,29 @@ class SAGINVisualizer:
             emulation_metrics_file: Path to emulation metrics JSON file
             output_file: Output filename (optional)
             num_slots: Number of time slots to plot (default: 25)
+            metrics: Already-loaded emulation metrics; emulation_metrics_file
+                is not read when given (optional)
+            max_slots: Aggregate into at most max_slots (and at most
+                DENSE_PLOT_BUCKETS) buckets of slots when more slots than
+                this are plotted; for callers plotting long runs, the
+                report's 25 slots are never aggregated (optional)
+            dpi: Resolution of saved images (default: DEFAULT_DPI)
         """
+        _plt()
         # Try to load emulation metrics
-        emulation_data = self._load_emulation_metrics(emulation_metrics_file)
+        emulation_data = metrics
+        if emulation_data is None:
+            emulation_data = self._load_emulation_metrics(emulation_metrics_file)
         
         if not emulation_data:
             print('Warning: Emulation metrics not found. Using example data structure.')
             print('Expected format: See documentation for emulation_metrics.json structure')
             # Use example structure for demonstration
             slots = list(range(1, num_slots + 1))
-            prop_trans_delay = np.random.uniform(10, 50, num_slots)  # ms
-            queuing_delay = np.random.uniform(5, 30, num_slots)  # ms
-            processing_delay = np.random.uniform(2, 15, num_slots)  # ms
+            # Propagation & transmission 10-50 ms, queuing 5-30 ms, processing 2-15 ms
+            rng = np.random.default_rng(0)
+            prop_trans_delay, queuing_delay, processing_delay = rng.uniform(
+                [10, 5, 2], [50, 30, 15], size=(num_slots, 3)).T
         else:
             slots = []
             prop_trans_delay = []
@@ -346,48 +928,65 @@ class SAGINVisualizer:
                                                      slot_data.get('controller_processing_delay', 0)))
         
         # Create stacked bar chart
-        fig, ax = plt.subplots(figsize=(14, 8))
+        fig, ax = plt.subplots(figsize=(14, 8), constrained_layout=True)
+        
+        # Stack the layers once; each layer sits on the cumulative sum of the ones below
+        layers = np.vstack([prop_trans_delay, queuing_delay, processing_delay]).astype(np.float64)
+        if max_slots is not None and len(slots) > max_slots:
+            # Long runs: one bar per bucket of slots, showing the mean latency
+            slots, layers = _bucket_slots(slots, layers,
+                                          num_buckets=min(max_slots, DENSE_PLOT_BUCKETS),
+                                          mean=True)
         
         width = 0.7
         x = np.arange(len(slots))
-        
-        # Create stacked bars
-        bars1 = ax.bar(x, prop_trans_delay, width, label='Propagation & Transmission', 
-                       color='#2ecc71', alpha=0.8)
-        bars2 = ax.bar(x, queuing_delay, width, bottom=prop_trans_delay, 
-                       label='Controller Queuing', color='#f39c12', alpha=0.8)
-        bars3 = ax.bar(x, processing_delay, width, 
-                       bottom=np.array(prop_trans_delay) + np.array(queuing_delay),
-                       label='Controller Processing', color='#e74c3c', alpha=0.8)
+        bottoms = np.vstack([np.zeros(len(slots)), np.cumsum(layers[:-1], axis=0)])
+        
+        # Create stacked bars, leaving out zero-height segments
+        shown = layers > 0
+        bars1 = ax.bar(x[shown[0]], layers[0][shown[0]], width, bottom=bottoms[0][shown[0]],
+                       label='Propagation & Transmission', color='#2ecc71', alpha=0.8,
+                       rasterized=True)
+        bars2 = ax.bar(x[shown[1]], layers[1][shown[1]], width, bottom=bottoms[1][shown[1]],
+                       label='Controller Queuing', color='#f39c12', alpha=0.8,
+                       rasterized=True)
+        bars3 = ax.bar(x[shown[2]], layers[2][shown[2]], width, bottom=bottoms[2][shown[2]],
+                       label='Controller Processing', color='#e74c3c', alpha=0.8,
+                       rasterized=True)
+        
+        # Logarithmic scale for better visualization; limits are set from the
+        # stack directly so matplotlib need not autoscale around zero bottoms
+        total_latency = layers.sum(axis=0)
+        tops = (bottoms + layers)[shown]
+        ax.set_yscale('log')
+        ax.set_ylim(tops.min() * 0.9 if tops.size else 1.0,
+                    total_latency.max() * 1.2 if tops.size else 10.0)
         
         # Customize plot
-        ax.set_xlabel('Time Slot', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Latency (milliseconds)', fontsize=12, fontweight='bold')
-        ax.set_title('Empirical Breakdown of Mean Flow Setup Latency', 
-                     fontsize=14, fontweight='bold')
+        ax.set_xlabel('Time Slot')
+        ax.set_ylabel('Latency (milliseconds)')
+        ax.set_title('Empirical Breakdown of Mean Flow Setup Latency')
         ax.set_xticks(x)
         ax.set_xticklabels(slots)
-        ax.set_yscale('log')  # Logarithmic scale for better visualization
-        ax.grid(True, alpha=0.3, axis='y')
-        ax.legend(loc='upper left', fontsize=10)
+        ax.grid(True, axis='y')
+        ax.legend(loc='upper left')
         
         # Add total latency annotation on top of bars
-        total_latency = np.array(prop_trans_delay) + np.array(queuing_delay) + np.array(processing_delay)
-        for i, (slot, total) in enumerate(zip(slots, total_latency)):
-            if i % 5 == 0:  # Annotate every 5th bar to avoid clutter
-                ax.text(i, total * 1.1, f'{total:.1f}ms', 
-                       ha='center', va='bottom', fontsize=8)
-        
-        plt.tight_layout()
+        for i in np.arange(0, len(slots), 5):  # Annotate every 5th bar to avoid clutter
+            total = total_latency[i]
+            ax.text(i, total * 1.1, f'{total:.1f}ms', 
+                   ha='center', va='bottom', fontsize=8)
         
         if output_file:
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
-            print('Saved flow setup latency breakdown to %s' % output_file)
+            plt.savefig(output_file, dpi=dpi)
+            print(f'Saved flow setup latency breakdown to {output_file}')
         else:
             plt.show()
     
+    @_styled
     def plot_controller_cpu_vs_adaptation_events(self, emulation_metrics_file='emulation_metrics.json',
-                                                  output_file=None, num_slots=25):
+                                                  output_file=None, num_slots=25, max_slots=None,
+                                                  metrics=None, dpi=DEFAULT_DPI):
         """
         Plot 2: Controller CPU Load vs. Dynamic Adaptation Events
         
@@ -398,25 +997,32 @@ class SAGINVisualizer:
             emulation_metrics_file: Path to emulation metrics JSON file
             output_file: Output filename (optional)
             num_slots: Number of time slots to plot (default: 25)
+            metrics: Already-loaded emulation metrics; emulation_metrics_file
+                is not read when given (optional)
+            max_slots: Aggregate into at most max_slots (and at most
+                DENSE_PLOT_BUCKETS) buckets of slots when more slots than
+                this are plotted; for callers plotting long runs, the
+                report's 25 slots are never aggregated (optional)
+            dpi: Resolution of saved images (default: DEFAULT_DPI)
         """
+        _plt()
         # Try to load emulation metrics
-        emulation_data = self._load_emulation_metrics(emulation_metrics_file)
+        emulation_data = metrics
+        if emulation_data is None:
+            emulation_data = self._load_emulation_metrics(emulation_metrics_file)
         
         if not emulation_data:
             print('Warning: Emulation metrics not found. Using example data structure.')
             print('Expected format: See documentation for emulation_metrics.json structure')
             # Use example structure for demonstration
             slots = list(range(1, num_slots + 1))
-            switch_handovers = np.random.randint(0, 5, num_slots)
-            full_reclustering = np.random.randint(0, 2, num_slots)
-            ga_reexecution = np.random.randint(0, 2, num_slots)
-            cpu_utilization = 30 + np.random.uniform(-10, 50, num_slots)
+            rng = np.random.default_rng(0)
+            switch_handovers, full_reclustering, ga_reexecution = rng.integers(
+                0, [5, 2, 2], size=(num_slots, 3)).T
+            cpu_utilization = 30 + rng.uniform(-10, 50, num_slots)
             # Add spikes for high-cost events
-            for i in range(num_slots):
-                if ga_reexecution[i] > 0:
-                    cpu_utilization[i] += 40
-                elif full_reclustering[i] > 0:
-                    cpu_utilization[i] += 25
+            cpu_utilization += np.where(ga_reexecution > 0, 40,
+                                        np.where(full_reclustering > 0, 25, 0))
         else:
             slots = []
             switch_handovers = []
@@ -441,52 +1047,68 @@ class SAGINVisualizer:
                                                      slot_data.get('avg_cpu_load', 0)))
         
         # Create dual-axis plot
-        fig, ax1 = plt.subplots(figsize=(14, 8))
+        fig, ax1 = plt.subplots(figsize=(14, 8), constrained_layout=True)
+        
+        layers = np.vstack([switch_handovers, full_reclustering, ga_reexecution]).astype(np.float64)
+        if max_slots is not None and len(slots) > max_slots:
+            # Long runs: total events and mean CPU load per bucket of slots
+            num_buckets = min(max_slots, DENSE_PLOT_BUCKETS)
+            _, layers = _bucket_slots(slots, layers, num_buckets=num_buckets)
+            slots, cpu_utilization = _bucket_slots(slots, [cpu_utilization],
+                                                   num_buckets=num_buckets, mean=True)
+            cpu_utilization = cpu_utilization[0]
         
         # Left Y-axis: Event counts (stacked bars)
         width = 0.7
         x = np.arange(len(slots))
         
-        bars1 = ax1.bar(x, switch_handovers, width, label='Switch Handovers',
-                       color='#3498db', alpha=0.8)
-        bars2 = ax1.bar(x, full_reclustering, width, bottom=switch_handovers,
-                       label='Full Re-clustering', color='#9b59b6', alpha=0.8)
-        bars3 = ax1.bar(x, ga_reexecution, width,
-                       bottom=np.array(switch_handovers) + np.array(full_reclustering),
-                       label='GA Re-execution', color='#e74c3c', alpha=0.8)
-        
-        ax1.set_xlabel('Time Slot', fontsize=12, fontweight='bold')
-        ax1.set_ylabel('Event Count', fontsize=12, fontweight='bold', color='#34495e')
-        ax1.set_title('Controller CPU Load vs. Dynamic Adaptation Events',
-                     fontsize=14, fontweight='bold')
+        bottoms = np.vstack([np.zeros(len(slots)), np.cumsum(layers[:-1], axis=0)])
+        
+        bars1 = ax1.bar(x, layers[0], width, bottom=bottoms[0],
+                       label='Switch Handovers', color='#3498db', alpha=0.8,
+                       rasterized=True)
+        bars2 = ax1.bar(x, layers[1], width, bottom=bottoms[1],
+                       label='Full Re-clustering', color='#9b59b6', alpha=0.8,
+                       rasterized=True)
+        bars3 = ax1.bar(x, layers[2], width, bottom=bottoms[2],
+                       label='GA Re-execution', color='#e74c3c', alpha=0.8,
+                       rasterized=True)
+        
+        ax1.set_xlabel('Time Slot')
+        ax1.set_ylabel('Event Count', color='#34495e')
+        ax1.set_title('Controller CPU Load vs. Dynamic Adaptation Events')
         ax1.set_xticks(x)
         ax1.set_xticklabels(slots)
         ax1.tick_params(axis='y', labelcolor='#34495e')
-        ax1.grid(True, alpha=0.3, axis='y')
-        ax1.legend(loc='upper left', fontsize=10)
+        ax1.grid(True, axis='y')
+        ax1.legend(loc='upper left')
         
         # Right Y-axis: CPU utilization (line plot)
         ax2 = ax1.twinx()
         line = ax2.plot(x, cpu_utilization, 'o-', color='#e67e22', linewidth=2.5,
-                       markersize=6, label='CPU Utilization', alpha=0.9)
-        ax2.set_ylabel('CPU Utilization (%)', fontsize=12, fontweight='bold', 
-                      color='#e67e22')
+                       markersize=6, label='CPU Utilization', alpha=0.9,
+                       rasterized=True)
+        ax2.set_ylabel('CPU Utilization (%)', color='#e67e22')
         ax2.tick_params(axis='y', labelcolor='#e67e22')
         ax2.set_ylim([0, 100])
         
         # Add legend for CPU line
-        ax2.legend(loc='upper right', fontsize=10)
+        ax2.legend(loc='upper right')
         
         # Highlight correlation: Add vertical lines where high-cost events occur
-        for i, (slot, ga, reclust) in enumerate(zip(slots, ga_reexecution, full_reclustering)):
-            if ga > 0 or reclust > 0:
-                ax1.axvline(x=i, color='red', linestyle='--', alpha=0.3, linewidth=1)
-        
-        plt.tight_layout()
+        # (one collection spanning the axes height, like axvline, in axes y-coordinates)
+        xs = np.flatnonzero((layers[2] > 0) | (layers[1] > 0))
+        segments = np.zeros((len(xs), 2, 2))
+        segments[:, :, 0] = xs[:, None]
+        segments[:, 1, 1] = 1
+        ax1.add_collection(LineCollection(segments, colors='red', linestyles='--',
+                                          alpha=0.3, linewidths=1,
+                                          transform=ax1.get_xaxis_transform()),
+                           autolim=False)
         
         if output_file:
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
-            print('Saved controller CPU vs adaptation events to %s' % output_file)
+            plt.savefig(output_file, dpi=dpi)
+            print(f'Saved controller CPU vs adaptation events to {output_file}')
         else:
             plt.show()
     
@@ -515,26 +1137,26 @@ class SAGINVisualizer:
             Dictionary with metrics data or None if file not found
         """
         # Try multiple locations
-        possible_paths = [
-            metrics_file,
-            os.path.join(os.path.dirname(__file__), metrics_file),
-            os.path.join(os.path.dirname(__file__), '../orchestrator', metrics_file),
-            os.path.join(os.path.dirname(__file__), '../results', metrics_file)
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                try:
-                    with open(path, 'r') as f:
-                        return json.load(f)
-                except Exception as e:
-                    print('Warning: Could not load emulation metrics from %s: %s' % (path, e))
+        path = self._resolve(metrics_file, [
+            _HERE,
+            os.path.join(_HERE, '../orchestrator'),
+            os.path.join(_HERE, '../results')
+        ])
+        if path is None:
+            return None
         
-        return None
+        # Parsed once per file version and shared by all plots using it
+        try:
+            return _load_json(path)
+        except Exception as e:
+            print(f'Warning: Could not load emulation metrics from {path}: {e}')
+            return None
     
+    @_styled
     def plot_matlab_vs_mininet_comparison(self, matlab_metrics_file='metrics_comosat.txt',
                                           emulation_metrics_file='emulation_metrics.json',
-                                          output_file=None, num_slots=25):
+                                          output_file=None, num_slots=25, metrics=None,
+                                          dpi=DEFAULT_DPI):
         """
         Plot 1: MATLAB vs. Mininet Emulation Comparison
         
@@ -545,47 +1167,47 @@ class SAGINVisualizer:
             emulation_metrics_file: Path to emulation metrics JSON file
             output_file: Output filename (optional)
             num_slots: Number of time slots to plot (default: 25)
+            metrics: Already-loaded emulation metrics; emulation_metrics_file
+                is not read when given (optional)
+            dpi: Resolution of saved images (default: DEFAULT_DPI)
         """
+        _plt()
         # Load MATLAB metrics
-        matlab_latencies = []
-        matlab_slots = []
+        matlab_latencies = np.empty(0)
+        matlab_slots = np.empty(0, dtype=np.int64)
         
         try:
             # Try to find MATLAB metrics file
-            matlab_paths = [
-                matlab_metrics_file,
-                os.path.join(os.path.dirname(__file__), '../..', matlab_metrics_file),
-                os.path.join(os.path.dirname(__file__), '../..', '..', matlab_metrics_file),
-                os.path.join(os.path.dirname(__file__), '../..', '..', '..', matlab_metrics_file),
-                os.path.join('/app/matlab_data', matlab_metrics_file)  # Docker path
-            ]
-            
-            matlab_file = None
-            for path in matlab_paths:
-                if os.path.exists(path):
-                    matlab_file = path
-                    break
+            matlab_file = self._resolve(matlab_metrics_file, [
+                os.path.join(_HERE, '../..'),
+                os.path.join(_HERE, '../..', '..'),
+                os.path.join(_HERE, '../..', '..', '..'),
+                '/app/matlab_data'  # Docker path
+            ])
             
             if matlab_file:
                 with open(matlab_file, 'r') as f:
-                    lines = f.readlines()
                     # Skip header lines and find data
-                    for line in lines:
-                        if line.strip() and not line.startswith('TimeSlot') and not line.startswith('-'):
-                            parts = line.split()
-                            if len(parts) >= 7:
-                                try:
-                                    slot = int(parts[0])
-                                    latency = float(parts[6])  # AvgFlowSetupDelay column
-                                    matlab_slots.append(slot)
-                                    matlab_latencies.append(latency)
-                                except (ValueError, IndexError):
-                                    continue
+                    lines = [line for line in f
+                             if line.strip() and not line.startswith(('TimeSlot', '-'))]
+                
+                if lines:
+                    # TimeSlot and AvgFlowSetupDelay columns, tokenized in C;
+                    # short rows are dropped and non-numeric fields become NaN
+                    with warnings.catch_warnings():
+                        warnings.simplefilter('ignore')
+                        data = np.genfromtxt(lines, usecols=(0, 6),
+                                             invalid_raise=False).reshape(-1, 2)
+                    data = data[~np.isnan(data).any(axis=1)]
+                    matlab_slots = data[:, 0].astype(np.int64)
+                    matlab_latencies = data[:, 1]
         except Exception as e:
-            print('Warning: Could not load MATLAB metrics: %s' % e)
+            print(f'Warning: Could not load MATLAB metrics: {e}')
         
         # Load emulation metrics
-        emulation_data = self._load_emulation_metrics(emulation_metrics_file)
+        emulation_data = metrics
+        if emulation_data is None:
+            emulation_data = self._load_emulation_metrics(emulation_metrics_file)
         
         mininet_slots = []
         mininet_latencies = []
@@ -604,57 +1226,59 @@ class SAGINVisualizer:
         else:
             # Generate example data for demonstration
             mininet_slots = list(range(1, num_slots + 1))
-            mininet_latencies = [np.random.uniform(30, 80) for _ in range(num_slots)]
+            mininet_latencies = np.random.default_rng(0).uniform(30, 80, num_slots)
             print('Warning: Using example data for Mininet latencies')
         
         # Create figure with two subplots
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10), sharex=True)
+        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10), sharex=True, constrained_layout=True)
         
         # Subplot 1: Comparison plot
-        if matlab_slots and matlab_latencies:
-            ax1.plot(matlab_slots, matlab_latencies, 'b--', marker='▲', 
+        if matlab_slots.size:
+            ax1.plot(matlab_slots, matlab_latencies, 'b--', marker='^', 
                     linewidth=2, markersize=8, label='MATLAB Model', alpha=0.8)
             # Add error bounds (±10%)
-            upper_bound = [x * 1.1 for x in matlab_latencies]
-            lower_bound = [x * 0.9 for x in matlab_latencies]
-            ax1.fill_between(matlab_slots, lower_bound, upper_bound, 
-                           alpha=0.2, color='blue', label='±10% Error Bounds')
+            upper_bound = matlab_latencies * 1.1
+            lower_bound = matlab_latencies * 0.9
+            _fill_band(ax1, matlab_slots, lower_bound, upper_bound,
+                       alpha=0.2, color='blue', label='±10% Error Bounds')
         
-        ax1.plot(mininet_slots, mininet_latencies, 'r-', marker='●', 
+        ax1.plot(mininet_slots, mininet_latencies, 'r-', marker='o', 
                 linewidth=2.5, markersize=8, label='Mininet Emulation', alpha=0.9)
         
-        ax1.set_ylabel('Flow Setup Latency (milliseconds)', fontsize=12, fontweight='bold')
-        ax1.set_title('Flow Setup Latency: Theoretical Model vs. Empirical Measurement', 
-                     fontsize=14, fontweight='bold')
-        ax1.legend(loc='best', fontsize=10)
-        ax1.grid(True, alpha=0.3)
+        ax1.set_ylabel('Flow Setup Latency (milliseconds)')
+        ax1.set_title('Flow Setup Latency: Theoretical Model vs. Empirical Measurement')
+        ax1.legend(loc='best')
+        ax1.grid(True)
         
         # Subplot 2: Absolute error
-        if matlab_slots and matlab_latencies:
+        if matlab_slots.size:
             # Match slots for comparison
-            common_slots = sorted(set(matlab_slots) & set(mininet_slots))
-            matlab_aligned = [matlab_latencies[matlab_slots.index(s)] for s in common_slots]
-            mininet_aligned = [mininet_latencies[mininet_slots.index(s)] for s in common_slots]
-            errors = [m - n for m, n in zip(matlab_aligned, mininet_aligned)]
+            # slot -> latency maps; built from the end so the first entry
+            # of a repeated slot wins
+            matlab_map = dict(zip(matlab_slots.tolist()[::-1], matlab_latencies.tolist()[::-1]))
+            mininet_map = dict(zip(mininet_slots[::-1], mininet_latencies[::-1]))
+            common_slots = sorted(matlab_map.keys() & mininet_map.keys())
+            errors = np.fromiter((matlab_map[s] - mininet_map[s] for s in common_slots),
+                                 dtype=np.float64, count=len(common_slots))
             
-            ax2.bar(common_slots, errors, alpha=0.7, color='purple', width=0.7)
+            _bar_collection(ax2, common_slots, errors, width=0.7, alpha=0.7,
+                            facecolor='purple', edgecolor='none')
             ax2.axhline(y=0, color='black', linestyle='-', linewidth=1)
-            ax2.set_xlabel('Time Slot', fontsize=12, fontweight='bold')
-            ax2.set_ylabel('Absolute Error (MATLAB - Mininet) (ms)', fontsize=12, fontweight='bold')
-            ax2.set_title('Model Accuracy: Absolute Error per Time Slot', 
-                         fontsize=12, fontweight='bold')
-            ax2.grid(True, alpha=0.3, axis='y')
-        
-        plt.tight_layout()
+            ax2.set_xlabel('Time Slot')
+            ax2.set_ylabel('Absolute Error (MATLAB - Mininet) (ms)')
+            ax2.set_title('Model Accuracy: Absolute Error per Time Slot', fontsize=12)
+            ax2.grid(True, axis='y')
         
         if output_file:
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
-            print('Saved MATLAB vs. Mininet comparison to %s' % output_file)
+            plt.savefig(output_file, dpi=dpi)
+            print(f'Saved MATLAB vs. Mininet comparison to {output_file}')
         else:
             plt.show()
     
+    @_styled
     def plot_queuing_delay_vs_arrival_rate(self, emulation_metrics_file='emulation_metrics.json',
-                                           output_file=None, num_slots=25):
+                                           output_file=None, num_slots=25, metrics=None,
+                                           dpi=DEFAULT_DPI):
         """
         Plot 6: Queuing Delay vs. Arrival Rate
         
@@ -664,49 +1288,59 @@ class SAGINVisualizer:
             emulation_metrics_file: Path to emulation metrics JSON file
             output_file: Output filename (optional)
             num_slots: Number of time slots to plot (default: 25)
+            metrics: Already-loaded emulation metrics; emulation_metrics_file
+                is not read when given (optional)
+            dpi: Resolution of saved images (default: DEFAULT_DPI)
+            
+        Returns:
+            The figure when it was neither saved nor shown (no output_file
+            and stdout is not a terminal), otherwise None
         """
+        _plt()
         # Load emulation metrics
-        emulation_data = self._load_emulation_metrics(emulation_metrics_file)
+        emulation_data = metrics
+        if emulation_data is None:
+            emulation_data = self._load_emulation_metrics(emulation_metrics_file)
         
-        arrival_rates = []
-        queuing_delays = []
-        slots = []
+        arrival_rates = np.empty(0)
         
         if emulation_data:
-            for slot in range(1, min(num_slots + 1, len(emulation_data) + 1)):
-                slot_data = emulation_data.get(str(slot), emulation_data.get(slot - 1, {}))
-                if slot_data:
-                    queuing_delay = slot_data.get('queuing_delay', 0)
-                    arrival_rate = slot_data.get('arrival_rate', 
-                                                 slot_data.get('packet_in_rate', 0))
-                    if queuing_delay > 0 and arrival_rate > 0:
-                        slots.append(slot)
-                        arrival_rates.append(arrival_rate)
-                        queuing_delays.append(queuing_delay)
-        
-        if not arrival_rates:
+            count = min(num_slots, len(emulation_data))
+            records = [emulation_data.get(str(slot), emulation_data.get(slot - 1, {})) or {}
+                       for slot in range(1, count + 1)]
+            # Read each field straight into a preallocated array, then keep
+            # only the slots where both values were measured
+            queuing_delays = np.fromiter((r.get('queuing_delay', 0) for r in records),
+                                         dtype=np.float64, count=count)
+            arrival_rates = np.fromiter((r.get('arrival_rate', r.get('packet_in_rate', 0))
+                                         for r in records),
+                                        dtype=np.float64, count=count)
+            measured = (queuing_delays > 0) & (arrival_rates > 0)
+            slots = np.arange(1, count + 1)[measured]
+            arrival_rates = arrival_rates[measured]
+            queuing_delays = queuing_delays[measured]
+        
+        if not arrival_rates.size:
             # Generate example data for demonstration
             print('Warning: Using example data for arrival rates and queuing delays')
-            slots = list(range(1, num_slots + 1))
-            arrival_rates = np.random.uniform(10, 100, num_slots)
-            queuing_delays = np.random.uniform(5, 50, num_slots)
+            slots = np.arange(1, num_slots + 1)
+            rng = np.random.default_rng(0)
+            arrival_rates = rng.uniform(10, 100, num_slots)
+            queuing_delays = rng.uniform(5, 50, num_slots)
             # Add some correlation
-            queuing_delays = [q * (1 + a/100) for q, a in zip(queuing_delays, arrival_rates)]
+            queuing_delays *= 1 + arrival_rates / 100
         
         # Calculate M/M/1 theoretical curve
         # Assume service rate μ = 100 packets/sec (adjust based on your system)
         mu = 100  # Service rate (packets/second)
-        theoretical_arrivals = np.linspace(0.1, mu * 0.9, 100)  # Avoid μ = λ
-        theoretical_delays = []
-        for lam in theoretical_arrivals:
-            if lam < mu:
-                delay = (lam / (mu * (mu - lam))) * 1000  # Convert to ms
-                theoretical_delays.append(delay)
-            else:
-                theoretical_delays.append(np.nan)
+        # Curve resolution follows the number of samples, within [50, 200]
+        n_theory = int(np.clip(len(arrival_rates) * 4, 50, 200))
+        theoretical_arrivals = np.linspace(0.1, mu * 0.9, n_theory)  # Avoid μ = λ
+        # W_q = λ / (μ(μ - λ)); every λ is below μ, so no masking is needed
+        theoretical_delays = theoretical_arrivals / (mu * (mu - theoretical_arrivals)) * 1000  # ms
         
         # Create plot
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig, ax = plt.subplots(figsize=(12, 8), constrained_layout=True)
         
         # Plot theoretical curve
         ax.plot(theoretical_arrivals, theoretical_delays, 'k--', 
@@ -719,101 +1353,150 @@ class SAGINVisualizer:
         
         # Add colorbar
         cbar = plt.colorbar(scatter, ax=ax)
-        cbar.set_label('Time Slot', fontsize=11, fontweight='bold')
+        cbar.set_label('Time Slot', fontsize=11)
         
-        ax.set_xlabel('PACKET-IN Arrival Rate (packets/second)', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Mean Queuing Delay (milliseconds)', fontsize=12, fontweight='bold')
-        ax.set_title('Controller Queuing Delay vs. PACKET-IN Arrival Rate', 
-                    fontsize=14, fontweight='bold')
-        ax.legend(loc='upper left', fontsize=10)
-        ax.grid(True, alpha=0.3)
+        ax.set_xlabel('PACKET-IN Arrival Rate (packets/second)')
+        ax.set_ylabel('Mean Queuing Delay (milliseconds)')
+        ax.set_title('Controller Queuing Delay vs. PACKET-IN Arrival Rate')
+        ax.legend(loc='upper left')
+        ax.grid(True)
         
         # Add annotation showing service rate
         ax.axvline(x=mu, color='red', linestyle=':', linewidth=1.5, alpha=0.5)
-        ax.text(mu * 1.05, ax.get_ylim()[1] * 0.9, f'μ = {mu} pkt/s', 
+        # Resolve the autoscaled limits once and pin them, so annotations
+        # placed from here on do not trigger another autoscale pass
+        xmin, xmax = ax.get_xlim()
+        ymin, ymax = ax.get_ylim()
+        ax.set_xlim(xmin, xmax)
+        ax.set_ylim(ymin, ymax)
+        ax.text(mu * 1.05, ymax * 0.9, f'μ = {mu} pkt/s',
                fontsize=10, color='red', fontweight='bold')
         
-        plt.tight_layout()
-        
         if output_file:
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
-            print('Saved queuing delay vs. arrival rate to %s' % output_file)
-        else:
+            plt.savefig(output_file, dpi=dpi)
+            print(f'Saved queuing delay vs. arrival rate to {output_file}')
+        elif sys.stdout.isatty():
             plt.show()
+        else:
+            # Not run from a terminal: hand the figure back instead of
+            # entering backend show logic
+            print('Warning: No output_file given and not running in a terminal; '
+                  'returning the figure unshown')
+            return fig
     
     def generate_report(self, metrics_file='simulation_metrics.json', 
                        output_dir='plots', include_emulation_plots=True,
-                       emulation_metrics_file='emulation_metrics.json'):
+                       emulation_metrics_file='emulation_metrics.json', workers=None,
+                       dpi=DEFAULT_DPI):
         """
         Generate complete visualization report.
         
+        Topology snapshots and emulation plots are independent figures and
+        are rendered in worker processes; the remaining plots are drawn here
+        meanwhile.
+        
         Args:
             metrics_file: Path to simulation metrics JSON file
             output_dir: Output directory for plots
             include_emulation_plots: Whether to include Mininet-specific plots
             emulation_metrics_file: Path to emulation metrics JSON file
+            workers: Number of worker processes (default: one per CPU, at
+                most one per plot); 1 renders every plot in this process
+            dpi: Resolution of saved images (default: DEFAULT_DPI)
         """
         # Create output directory
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
+        _use_file_backend()
         
         print('Generating visualization report...')
         
-        # Generate topology plots for multiple slots
-        num_slots_to_plot = min(5, len(self.topology_data['time_slots']))
-        for slot in range(1, num_slots_to_plot + 1):
-            output_file = os.path.join(output_dir, 'topology_slot_%d.png' % slot)
-            self.plot_topology(slot, output_file, show_map=True)
-        
-        # Generate remapping statistics
-        try:
-            output_file = os.path.join(output_dir, 'remapping_statistics.png')
-            self.plot_remapping_statistics(metrics_file, output_file)
-        except FileNotFoundError:
-            print('Metrics file not found, skipping remapping statistics')
-        
-        # Generate controller evolution (Plot 5: Topology Evolution)
-        output_file = os.path.join(output_dir, 'controller_evolution.png')
-        num_slots_total = len(self.topology_data.get('time_slots', []))
-        if num_slots_total >= 22:
-            self.plot_controller_evolution(output_file, slots=[1, 8, 15, 22])
-        else:
-            self.plot_controller_evolution(output_file)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        # (method, kwargs, optional): failures of optional plots are reported
+        # and skipped, others are raised
+        tasks = []
+        
+        # Generate topology plots for multiple slots; each run of slots
+        # shares one figure, with one run per worker
+        num_slots_to_plot = min(5, self._num_slots)
+        if num_slots_to_plot:
+            all_slots = np.arange(1, num_slots_to_plot + 1)
+            for run in np.array_split(all_slots, min(workers, num_slots_to_plot)):
+                tasks.append(('_plot_topology_series', {
+                    'slots': run.tolist(),
+                    'output_dir': output_dir,
+                    'max_points': DENSE_PLOT_MAX_POINTS,
+                    'dpi': dpi,
+                }, False))
         
         # Generate Mininet-specific emulation plots
-        num_slots = len(self.topology_data.get('time_slots', []))
-        num_slots_plot = min(num_slots, 25)
+        num_slots_plot = min(self._num_slots, 25)
         
         if include_emulation_plots:
-            try:
+            # Parsed once here and shared by all four emulation plots
+            emulation_metrics = self._load_emulation_metrics(emulation_metrics_file)
+            emulation_kwargs = {
+                'emulation_metrics_file': emulation_metrics_file,
+                'num_slots': num_slots_plot,
+                'metrics': emulation_metrics,
+                'dpi': dpi,
+            }
+            for method, filename in [
                 # Plot 1: MATLAB vs. Mininet Comparison
-                output_file = os.path.join(output_dir, 'matlab_vs_mininet_comparison.png')
-                self.plot_matlab_vs_mininet_comparison(
-                    emulation_metrics_file=emulation_metrics_file,
-                    output_file=output_file,
-                    num_slots=num_slots_plot
-                )
-                
+                ('plot_matlab_vs_mininet_comparison', 'matlab_vs_mininet_comparison.png'),
                 # Plot 2: Flow setup latency breakdown
-                output_file = os.path.join(output_dir, 'flow_setup_latency_breakdown.png')
-                self.plot_flow_setup_latency_breakdown(emulation_metrics_file, 
-                                                       output_file, 
-                                                       num_slots=num_slots_plot)
-                
+                ('plot_flow_setup_latency_breakdown', 'flow_setup_latency_breakdown.png'),
                 # Plot 4: CPU load vs adaptation events
-                output_file = os.path.join(output_dir, 'controller_cpu_vs_adaptation.png')
-                self.plot_controller_cpu_vs_adaptation_events(emulation_metrics_file,
-                                                              output_file,
-                                                              num_slots=num_slots_plot)
-                
+                ('plot_controller_cpu_vs_adaptation_events', 'controller_cpu_vs_adaptation.png'),
                 # Plot 6: Queuing Delay vs. Arrival Rate
-                output_file = os.path.join(output_dir, 'queuing_delay_vs_arrival_rate.png')
-                self.plot_queuing_delay_vs_arrival_rate(emulation_metrics_file,
-                                                        output_file,
-                                                        num_slots=num_slots_plot)
-            except Exception as e:
-                print('Warning: Could not generate emulation plots: %s' % e)
-                print('Emulation plots will use example data. See documentation for data collection.')
+                ('plot_queuing_delay_vs_arrival_rate', 'queuing_delay_vs_arrival_rate.png'),
+            ]:
+                tasks.append((method, dict(emulation_kwargs,
+                                           output_file=os.path.join(output_dir, filename)), True))
+        
+        futures = [None] * len(tasks)
+        executor = None
+        if workers > 1 and len(tasks) > 1:
+            try:
+                executor = ProcessPoolExecutor(max_workers=min(workers, len(tasks)),
+                                               initializer=_init_plot_worker,
+                                               initargs=(self,))
+                futures = [executor.submit(_run_plot_task, task) for task in tasks]
+            except (OSError, BrokenProcessPool) as e:
+                print(f'Warning: Could not start plot workers ({e}), plotting serially')
+        
+        try:
+            # Generate remapping statistics
+            try:
+                output_file = os.path.join(output_dir, 'remapping_statistics.png')
+                self.plot_remapping_statistics(metrics_file, output_file, dpi=dpi)
+            except FileNotFoundError:
+                print('Metrics file not found, skipping remapping statistics')
+            
+            # Generate controller evolution (Plot 5: Topology Evolution)
+            output_file = os.path.join(output_dir, 'controller_evolution.png')
+            self.plot_controller_evolution(output_file, slots=self._default_evolution_slots,
+                                           dpi=dpi)
+            
+            # Collect worker results; plots whose worker died are drawn here
+            for (method, kwargs, optional), future in zip(tasks, futures):
+                try:
+                    if future is not None:
+                        try:
+                            future.result()
+                            continue
+                        except BrokenProcessPool as e:
+                            print(f'Warning: Plot worker failed ({e}), plotting {method} here')
+                    getattr(self, method)(**kwargs)
+                except Exception as e:
+                    if not optional:
+                        raise
+                    print(f'Warning: Could not generate emulation plots: {e}')
+                    print('Emulation plots will use example data. See documentation for data collection.')
+        finally:
+            if executor is not None:
+                executor.shutdown()
         
         print('Visualization report complete!')
         print('Generated all 6 journal plots:')
@@ -848,8 +1531,11 @@ def main():
                        help='Generate CPU load vs adaptation events plot only')
     parser.add_argument('--no-emulation-plots', action='store_true',
                        help='Exclude Mininet-specific emulation plots')
+    parser.add_argument('--hi-res', action='store_true',
+                       help=f'Save plots at {HI_RES_DPI} dpi instead of {DEFAULT_DPI}')
     
     args = parser.parse_args()
+    dpi = HI_RES_DPI if args.hi_res else DEFAULT_DPI
     
     # Create visualizer
     topo_file = os.path.join(os.path.dirname(__file__), '../topology', args.topology)
@@ -858,16 +1544,15 @@ def main():
     if args.flow_latency:
         # Generate only flow latency breakdown plot
         output_file = os.path.join(args.output, 'flow_setup_latency_breakdown.png')
-        if not os.path.exists(args.output):
-            os.makedirs(args.output)
-        visualizer.plot_flow_setup_latency_breakdown(args.emulation_metrics, output_file)
+        os.makedirs(args.output, exist_ok=True)
+        visualizer.plot_flow_setup_latency_breakdown(args.emulation_metrics, output_file, dpi=dpi)
         
     elif args.cpu_adaptation:
         # Generate only CPU vs adaptation events plot
         output_file = os.path.join(args.output, 'controller_cpu_vs_adaptation.png')
-        if not os.path.exists(args.output):
-            os.makedirs(args.output)
-        visualizer.plot_controller_cpu_vs_adaptation_events(args.emulation_metrics, output_file)
+        os.makedirs(args.output, exist_ok=True)
+        visualizer.plot_controller_cpu_vs_adaptation_events(args.emulation_metrics, output_file,
+                                                            dpi=dpi)
         
     elif args.all:
         # Generate complete report
@@ -877,11 +1562,11 @@ def main():
                                      args.emulation_metrics)
         visualizer.generate_report(metrics_file, args.output, 
                                   include_emulation_plots=not args.no_emulation_plots,
-                                  emulation_metrics_file=emulation_file)
+                                  emulation_metrics_file=emulation_file, dpi=dpi)
         
     elif args.slot:
         # Plot specific slot
-        visualizer.plot_topology(args.slot, show_map=True)
+        visualizer.plot_topology(args.slot, show_map=True, dpi=dpi)
         
     else:
         # Default: generate report
@@ -891,7 +1576,7 @@ def main():
                                      args.emulation_metrics)
         visualizer.generate_report(metrics_file, args.output,
                                   include_emulation_plots=not args.no_emulation_plots,
-                                  emulation_metrics_file=emulation_file)
+                                  emulation_metrics_file=emulation_file, dpi=dpi)
 
 
 if __name__ == '__main__':